@@ -44,10 +44,13 @@ class PreviewFrame(wx.Frame):
         # change later.
 
         # NOTE: when you pass a CustomConfig object to a custom
-        # control, it internally creates its own copy of the
-        # CustomConfig object (essentially getting its value instead
-        # of reference). This is done to prevent unwanted behavior
-        # when altering the original CustomConfig object.
+        # control, it does not copy it. The control reads from the
+        # shared CustomConfig through an overlay, and any change made
+        # through the control (UpdateConfig, SetBackgroundColour,
+        # etc.) is stored in that overlay, so the original
+        # CustomConfig object is never altered by the control. On the
+        # other hand, changing the shared CustomConfig itself updates
+        # every control that uses it in a single repaint pass.
 
         # only the default appearance of the custom controls will be
         # changed in this preview, but modifying the appearance for
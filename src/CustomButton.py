@@ -33,6 +33,11 @@ class CustomButton(CustomControl):
 
     def __OnPaint(self, event):
 
+        # ------------------ retained bitmap ------------------ #
+
+        if self._paintRetainedBitmap():
+            return
+
         # --------------------- contexts --------------------- #
 
         gcdc, gc = self._getDrawingContexts()
@@ -41,27 +46,24 @@ class CustomButton(CustomControl):
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # ---------------------- cursor ---------------------- #
-
-        self.SetCursor(drawing_properties["cursor"])
-
         # ------------ drawing area and background ------------ #
 
         controlRect:wx.Rect = self.GetClientRect() # control area
 
         # control background
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
 
         # ----------------- button rectangle ----------------- #
 
-        buttonRectangle = controlRect.Deflate(drawing_properties["pen"].GetWidth(),
-                                              drawing_properties["pen"].GetWidth())
+        buttonRectangle = controlRect.Deflate(drawing_properties.pen.GetWidth(),
+                                              drawing_properties.pen.GetWidth())
 
-        gcdc.SetPen(drawing_properties["pen"])
-        gc.SetBrush(drawing_properties["brush_background"])
-        gcdc.DrawRoundedRectangle(buttonRectangle, drawing_properties["corner_radius"])
+        if not self._drawNineSlice(gc, drawing_properties, buttonRectangle, drawing_properties.corner_radius):
+            gcdc.SetPen(drawing_properties.pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
+            gcdc.DrawRoundedRectangle(buttonRectangle, drawing_properties.corner_radius)
 
         # ------------------ text dimensions ------------------ #
         
@@ -81,15 +83,12 @@ class CustomButton(CustomControl):
 
     def DoGetBestClientSize(self) -> wx.Size:
         
-        dc = wx.ClientDC(self)
-        gcdc:wx.GCDC = wx.GCDC(dc)
-
         # image = self._getIfImage()
-        textWidth, textHeight = self._getDefaultTextExtent(gcdc, self._Label)
+        textWidth, textHeight = self._getDefaultTextExtent(self._Label)
         imageWidth, imageHeight = self._getMaxDimensions("image")
-        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6)
-        padding_horizontal = dip(10)
-        padding_vertical = dip(5)
+        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6, window=self)
+        padding_horizontal = dip(10, window=self)
+        padding_vertical = dip(5, window=self)
 
         width, height = self._getObjectSideDimensions(imageWidth, imageHeight,
                                                       textWidth, textHeight,text_separation,
@@ -102,17 +101,19 @@ class CustomButton(CustomControl):
 
     def __OnLeftDown(self, event):
         if not self._Pressed:
+            oldState = self.GetStateAsString()
             self.CaptureMouse()
             self._Pressed = True
-            self.Refresh()
+            self._onStateChanged(oldState)
         event.Skip()
 
 
     def __OnLeftUp(self, event):
         if self._Pressed:
+            oldState = self.GetStateAsString()
             self.ReleaseMouse()
             self._Pressed = False
-            self.Refresh()
+            self._onStateChanged(oldState)
             if self._Hover:
                 wx.PostEvent(self, wx.PyCommandEvent(wx.EVT_BUTTON.typeId, self.GetId()))
         event.Skip()
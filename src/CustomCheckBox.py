@@ -8,6 +8,7 @@ import wx
 from copy import copy
 from .base._CustomControl import CustomControl
 from .utils.dip import dip
+from .utils.gdiPool import acquirePen
 
 
 class CustomCheckBox(CustomControl):
@@ -36,6 +37,11 @@ class CustomCheckBox(CustomControl):
 
     def __OnPaint(self, event):
 
+        # ------------------ retained bitmap ------------------ #
+
+        if self._paintRetainedBitmap():
+            return
+
         # --------------------- contexts --------------------- #
         
         gcdc, gc = self._getDrawingContexts()
@@ -44,16 +50,12 @@ class CustomCheckBox(CustomControl):
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # ---------------------- cursor ---------------------- #
-        
-        self.SetCursor(drawing_properties["cursor"])
-
         # ------------ drawing area and background ------------ #
 
         controlRect:wx.Rect = self.GetClientRect() # control area
 
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
 
         # ------------------ get dimensions ------------------ #
@@ -89,11 +91,11 @@ class CustomCheckBox(CustomControl):
         # draw background for selector depending on state
         if self._Value:
             gcdc.SetPen(wx.TRANSPARENT_PEN)
-            gc.SetBrush(wx.Brush(wx.Colour(drawing_properties["background_colour_active"])))
+            gc.SetBrush(drawing_properties.brush_background_active)
         else:
-            gcdc.SetPen(drawing_properties["pen"])
-            gc.SetBrush(drawing_properties["brush_background"])
-        gcdc.DrawRoundedRectangle(selectorRectangle, radius=drawing_properties["corner_radius"])
+            gcdc.SetPen(drawing_properties.pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
+        gcdc.DrawRoundedRectangle(selectorRectangle, radius=drawing_properties.corner_radius)
 
         # if checkbox is active
         if (self._Value and not self._config.switch_appearance):
@@ -101,7 +103,7 @@ class CustomCheckBox(CustomControl):
             # checkmark rectangle area
             checkRect:wx.Rect = copy(selectorRectangle).Deflate(int(self._config.checkbox_active_deflate*1.2), 
                                                                 int(self._config.checkbox_active_deflate*1.3))
-            gcdc.SetPen(wx.Pen(wx.WHITE, width=2))
+            gcdc.SetPen(self._holdResource("checkmark", acquirePen, wx.WHITE, 2))
             gcdc.SetBrush(wx.TRANSPARENT_BRUSH)
             # draw checkmark
             path:wx.GraphicsPath = gc.CreatePath()
@@ -121,12 +123,14 @@ class CustomCheckBox(CustomControl):
                 
             # draw switch on/off indicator
             if self._config.switch_selector_border_width:
-                pen = wx.Pen(wx.Colour(*self._config.switch_selector_border_colour), self._config.switch_selector_border_width)
+                pen = self._holdResource("switch_selector", acquirePen,
+                                         self._config.switch_selector_border_colour,
+                                         self._config.switch_selector_border_width)
             else:
                 pen = wx.TRANSPARENT_PEN
             
             gcdc.SetPen(pen)
-            gc.SetBrush(drawing_properties["brush_foreground"])
+            gc.SetBrush(self._getFillBrush(drawing_properties, "foreground"))
             
             if self._config.switch_rounded:
                 gcdc.DrawEllipse(selectionX + self._config.switch_selector_padding,
@@ -143,13 +147,10 @@ class CustomCheckBox(CustomControl):
 
     def DoGetBestClientSize(self) -> wx.Size:
 
-        dc = wx.ClientDC(self)
-        gcdc:wx.GCDC = wx.GCDC(dc)
-
-        textWidth, textHeight = self._getDefaultTextExtent(gcdc, self._Label)
+        textWidth, textHeight = self._getDefaultTextExtent(self._Label)
         imageWidth, imageHeight = self._getMaxDimensions("image")
         sidePadding = self._getMaxDimensions("border_width")
-        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6)
+        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6, window=self)
         textImageWidth, textImageHeight = self._getObjectSideDimensions(imageWidth, imageHeight,
                                                                         textWidth, textHeight,
                                                                         text_separation,
@@ -169,19 +170,22 @@ class CustomCheckBox(CustomControl):
 
     def __OnLeftDown(self, event):
         if not self._Pressed:
+            oldState = self.GetStateAsString()
             self.CaptureMouse()
             self._Pressed = True
-            self.Refresh()
+            self._onStateChanged(oldState)
         event.Skip()
 
 
     def __OnLeftUp(self, event):
         if self._Pressed:
+            oldState = self.GetStateAsString()
             self.ReleaseMouse()
             self._Pressed = False
             if self._Hover:
                 self._Value = not self._Value
                 wx.PostEvent(self, wx.PyCommandEvent(wx.EVT_CHECKBOX.typeId, self.GetId()))                
-            self.Refresh()
+                self._requestRefresh() # the value changed
+            self._onStateChanged(oldState)
         event.Skip()
     
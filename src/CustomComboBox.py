@@ -9,7 +9,9 @@ from .base._CustomControl import CustomControl
 from .CustomDropDown import CustomDropDown
 from .CustomScrolledWindow import CustomScrolledWindow
 from .CustomButton import CustomButton
-from .utils.dip import dip
+from .utils.dip import dip, getWindowScaleFactor
+from .utils.textMetrics import getTextExtents
+from .utils.gdiPool import acquirePen
 
 
 # class CustomComboBoxDropDown(CustomDropDown):
@@ -33,7 +35,7 @@ from .utils.dip import dip
 #             btn.Bind(wx.EVT_BUTTON, self.__OnButton)
 
 from .CustomConfig import CustomConfig
-from .functions.getDefaultConfig import getDefaultConfig
+from .functions.getDefaultConfig import getSharedDefaultConfig
 
 class CustomComboBoxValuesPanel(wx.PopupTransientWindow):
 
@@ -61,6 +63,11 @@ class CustomComboBoxValuesPanel(wx.PopupTransientWindow):
         #self._Panel.SetBackgroundColour(wx.CYAN)
         
         self._PanelSizer = wx.GridBagSizer()
+
+        # measure all the choices at once, so the buttons find their
+        # label extents in the text cache
+        getTextExtents(self._Choices, self._config.text_font_size_default,
+                       self._config.text_font_facename_default)
         #for i in range(10):
         #    self._PanelSizer.Add(CustomButton(self._Panel, label="Placeholder"), pos=(i, 0), flag=wx.EXPAND)
         
@@ -94,8 +101,8 @@ class CustomComboBoxValuesPanel(wx.PopupTransientWindow):
         # events)
         #self._ChoiceRectangles = {}
 
-        self._PaddingHorizontal = dip(14)
-        self._PaddingVertical = dip(7)
+        self._PaddingHorizontal = dip(14, window=self)
+        self._PaddingVertical = dip(7, window=self)
 
         self.SetInitialSize(size)
 
@@ -127,27 +134,20 @@ class CustomComboBoxValuesPanel(wx.PopupTransientWindow):
 
     def DoGetBestClientSize(self):
 
-        dc = wx.ClientDC(self)
-        gc:wx.GraphicsContext = wx.GraphicsContext.Create(dc)
-
-        gc.SetFont(wx.Font(self._config.text_font_size_default,
-                           wx.FONTFAMILY_DEFAULT,
-                           wx.FONTSTYLE_NORMAL,
-                           wx.FONTWEIGHT_NORMAL, faceName=self._config.text_font_facename_default), wx.BLACK)
-
-        
         longestChoice = max([len(string) for string in self._Choices])
 
         newString = "".join(["A" for _ in range(longestChoice)])
 
-        textWidth, textHeight, _, _ = gc.GetFullTextExtent(newString)
+        textWidth, textHeight = getTextExtents([newString],
+                                               self._config.text_font_size_default,
+                                               self._config.text_font_facename_default)[0]
 
         fullHeight = len(self._Choices) * textHeight * 2
 
         maxHeight = 150
 
         width = textWidth * 5
-        height =  fullHeight if (fullHeight < dip(maxHeight)) else dip(maxHeight)
+        height =  fullHeight if (fullHeight < dip(maxHeight, window=self)) else dip(maxHeight, window=self)
         
         return wx.Size(int(width), int(height))
 
@@ -200,6 +200,11 @@ class CustomComboBox(CustomControl):
 
     def __OnPaint(self, event):
 
+        # ------------------ retained bitmap ------------------ #
+
+        if self._paintRetainedBitmap():
+            return
+
         # --------------------- contexts --------------------- #
 
         gcdc, gc = self._getDrawingContexts()
@@ -208,27 +213,24 @@ class CustomComboBox(CustomControl):
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # ---------------------- cursor ---------------------- #
-
-        self.SetCursor(drawing_properties["cursor"])
-
         # ------------ drawing area and background ------------ #
 
         controlRect:wx.Rect = self.GetClientRect() # control area
 
         # control background
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
 
         # ----------------- combobox rectangle ----------------- #
 
-        comboboxRectangle = controlRect.Deflate(drawing_properties["pen"].GetWidth(),
-                                              drawing_properties["pen"].GetWidth())
+        comboboxRectangle = controlRect.Deflate(drawing_properties.pen.GetWidth(),
+                                              drawing_properties.pen.GetWidth())
 
-        gcdc.SetPen(drawing_properties["pen"])
-        gc.SetBrush(drawing_properties["brush_background"])
-        gcdc.DrawRoundedRectangle(comboboxRectangle, drawing_properties["corner_radius"])
+        if not self._drawNineSlice(gc, drawing_properties, comboboxRectangle, drawing_properties.corner_radius):
+            gcdc.SetPen(drawing_properties.pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
+            gcdc.DrawRoundedRectangle(comboboxRectangle, drawing_properties.corner_radius)
 
         # ---------------------- get dimensions ------------------------ #
         
@@ -248,14 +250,14 @@ class CustomComboBox(CustomControl):
         # ---------------------- create rectangles ------------------------ #
 
         # temp hackathon
-        imageTextRectX = dip(5) if (self._config.arrow_text_side == "left") else comboboxRectangle.GetWidth() - dip(5) - imageTextRectWidth
+        imageTextRectX = dip(5, window=self) if (self._config.arrow_text_side == "left") else comboboxRectangle.GetWidth() - dip(5, window=self) - imageTextRectWidth
 
         imageTextRect = wx.Rect(imageTextRectX, imageTextRectY, imageTextRectWidth, imageTextRectHeight)
         arrowRectangle = wx.Rect(arrowX, arrowY, self._config.arrow_width, self._config.arrow_height)
 
         # ---------------------- draw arrow ------------------------ #
 
-        gc.SetPen(wx.Pen(wx.Colour(*self._config.arrow_colour)))
+        gc.SetPen(self._holdResource("arrow", acquirePen, self._config.arrow_colour))
         path:wx.GraphicsPath = gc.CreatePath()
         path.MoveToPoint(arrowRectangle.GetX(), arrowRectangle.GetY())
         path.AddLineToPoint(arrowRectangle.GetX() + arrowRectangle.GetWidth()//2, arrowRectangle.GetY() + arrowRectangle.GetHeight())
@@ -272,15 +274,12 @@ class CustomComboBox(CustomControl):
     
     def DoGetBestClientSize(self) -> wx.Size:
         
-        dc = wx.ClientDC(self)
-        gcdc:wx.GCDC = wx.GCDC(dc)
-
         # image = self._getIfImage()
-        textWidth, textHeight = self._getDefaultTextExtent(gcdc, self._Value)
+        textWidth, textHeight = self._getDefaultTextExtent(self._Value)
         imageWidth, imageHeight = self._getMaxDimensions("image")
-        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6)
-        padding_horizontal = dip(10)
-        padding_vertical = dip(5)
+        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6, window=self)
+        padding_horizontal = dip(10, window=self)
+        padding_vertical = dip(5, window=self)
 
         width, height = self._getObjectSideDimensions(imageWidth, imageHeight,
                                                       textWidth, textHeight,text_separation,
@@ -296,22 +295,24 @@ class CustomComboBox(CustomControl):
 
     def __OnLeftDown(self, event):
         if not self._Pressed:
+            oldState = self.GetStateAsString()
             self.CaptureMouse()
             self._Pressed = True
-            self.Refresh()
+            self._onStateChanged(oldState)
         event.Skip()
 
 
     def __OnLeftUp(self, event):
         if self._Pressed:
+            oldState = self.GetStateAsString()
             self.ReleaseMouse()
             self._Pressed = False
-            self.Refresh()
+            self._onStateChanged(oldState)
             if self._Hover:
                 wx.PostEvent(self, wx.PyCommandEvent(wx.EVT_COMBOBOX.typeId, self.GetId()))
 
             try:
-                self._ChoicesPanel = CustomComboBoxValuesPanel(self, choices=self._Choices, config=getDefaultConfig("CustomButton"))
+                self._ChoicesPanel = CustomComboBoxValuesPanel(self, choices=self._Choices, config=getSharedDefaultConfig("CustomButton", getWindowScaleFactor(self)))
                 ctrl = event.GetEventObject()
                 pos = ctrl.ClientToScreen((0, 0))
                 sz = ctrl.GetSize()
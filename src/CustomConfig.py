@@ -1,179 +1,419 @@
 # controlConfig.py
 # wxCustomControls
 # Class for handling control appearance configuration. Sets default
-# valuesif not specified as keyword arguments.
+# valuesif not specified as keyword arguments. The fields are declared
+# in a schema, which generates the slots of the config class.
 # 28/oct/2024
 
 
 import wx
+import weakref
+from copy import copy
+from collections import namedtuple
+from .utils.repaintQueue import scheduleConfigRepaint
 
 
-class CustomConfig:
-    def __init__(self, **kwargs):
+# -------------------------- schema -------------------------- #
+
+# effect: the least amount of work needed after the field changes.
+#   "paint": a repaint.
+#   "layout": a best size invalidation and a relayout of the parent.
+#   "structural": a rebuild of the parts created from the field (for
+#   example the scrollbars of a CustomScrolledWindow).
+# dip: the field is a length in pixels that was scaled for the DPI, so
+# it has to be rescaled when the DPI changes.
+ConfigField = namedtuple("ConfigField", ("name", "type", "default", "category", "effect", "dip"),
+                         defaults=(False,))
+
+STATES = ("default", "pressed", "hover", "disabled")
+
+NoneType = type(None)
+
+_MISSING = object()
+
 
-        # ---------------------- cursor ---------------------- #
+def _stateFields(prefix:str, fieldType, default, category:str, effect:str, dip=False, states=STATES) -> tuple:
+    """Returns one field per control state."""
+    return tuple(ConfigField(f"{prefix}_{state}", fieldType, default, category, effect, dip) for state in states)
 
-        self.cursor_stockcursor_pressed  = kwargs.get("cursor_stockcursor_pressed",  wx.CURSOR_ARROW)
-        self.cursor_stockcursor_hover    = kwargs.get("cursor_stockcursor_hover",    wx.CURSOR_ARROW)
-        self.cursor_stockcursor_disabled = kwargs.get("cursor_stockcursor_disabled", wx.CURSOR_ARROW)
 
-        # ----------------------- text ----------------------- #
+def _toTuple(value):
+    """Converts lists (nested ones too) to tuples."""
+    if isinstance(value, list):
+        return tuple(_toTuple(item) for item in value)
+    return value
 
-        self.text_font_size_default  = kwargs.get("text_font_size_default",  8)
-        self.text_font_size_pressed  = kwargs.get("text_font_size_pressed",  8)
-        self.text_font_size_hover    = kwargs.get("text_font_size_hover",    8)
-        self.text_font_size_disabled = kwargs.get("text_font_size_disabled", 8)
-        
-        self.text_font_facename_default  = kwargs.get("text_font_facename_default",  "Verdana")
-        self.text_font_facename_pressed  = kwargs.get("text_font_facename_pressed",  "Verdana")
-        self.text_font_facename_hover    = kwargs.get("text_font_facename_hover",    "Verdana")
-        self.text_font_facename_disabled = kwargs.get("text_font_facename_disabled", "Verdana")
 
-        self.text_foreground_colour_default  = kwargs.get("text_foreground_colour_default",  (0, 0, 0))
-        self.text_foreground_colour_pressed  = kwargs.get("text_foreground_colour_pressed",  (0, 0, 0))
-        self.text_foreground_colour_hover    = kwargs.get("text_foreground_colour_hover",    (0, 0, 0))
-        self.text_foreground_colour_disabled = kwargs.get("text_foreground_colour_disabled", (0, 0, 0))
+CONFIG_FIELDS = (
 
-        # -------------------- background -------------------- #
+    # ---------------------- cursor ---------------------- #
 
-        self.background_colour_default  = kwargs.get("background_colour_default",  (255, 255, 255))
-        self.background_colour_pressed  = kwargs.get("background_colour_pressed",  (255, 255, 255))
-        self.background_colour_hover    = kwargs.get("background_colour_hover",    (255, 255, 255))
-        self.background_colour_disabled = kwargs.get("background_colour_disabled", (255, 255, 255))
+    *_stateFields("cursor_stockcursor", int, wx.CURSOR_ARROW, "cursor", "paint", states=STATES[1:]),
 
-        self.foreground_colour_default  = kwargs.get("foreground_colour_default",  (255, 255, 255))
-        self.foreground_colour_pressed  = kwargs.get("foreground_colour_pressed",  (255, 255, 255))
-        self.foreground_colour_hover    = kwargs.get("foreground_colour_hover",    (255, 255, 255))
-        self.foreground_colour_disabled = kwargs.get("foreground_colour_disabled", (255, 255, 255))
+    # ----------------------- text ----------------------- #
 
-        # --------------------- gradients --------------------- #
+    *_stateFields("text_font_size", (int, float), 8, "text", "layout"),
+    *_stateFields("text_font_facename", str, "Verdana", "text", "layout"),
+    *_stateFields("text_foreground_colour", tuple, (0, 0, 0), "text", "paint"),
 
-        self.background_linear_gradient_default  = kwargs.get("background_linear_gradient_default",  None)
-        self.background_linear_gradient_pressed  = kwargs.get("background_linear_gradient_pressed",  None)
-        self.background_linear_gradient_hover    = kwargs.get("background_linear_gradient_hover",    None)
-        self.background_linear_gradient_disabled = kwargs.get("background_linear_gradient_disabled", None)
+    # -------------------- background -------------------- #
 
-        self.foreground_linear_gradient_default  = kwargs.get("foreground_linear_gradient_default",  None)
-        self.foreground_linear_gradient_pressed  = kwargs.get("foreground_linear_gradient_pressed",  None)
-        self.foreground_linear_gradient_hover    = kwargs.get("foreground_linear_gradient_hover",    None)
-        self.foreground_linear_gradient_disabled = kwargs.get("foreground_linear_gradient_disabled", None)
+    *_stateFields("background_colour", tuple, (255, 255, 255), "background", "paint"),
+    *_stateFields("foreground_colour", tuple, (255, 255, 255), "background", "paint"),
 
-        # ---------------------- borders ---------------------- #
+    # --------------------- gradients --------------------- #
 
-        self.border_colour_default  = kwargs.get("border_colour_default",  (0, 0, 0))
-        self.border_colour_pressed  = kwargs.get("border_colour_pressed",  (0, 0, 0))
-        self.border_colour_hover    = kwargs.get("border_colour_hover",    (0, 0, 0))
-        self.border_colour_disabled = kwargs.get("border_colour_disabled", (0, 0, 0))
+    # (x1, y1, x2, y2, colour1, colour2[, colour3...]) or
+    # (x1, y1, x2, y2, ((position, colour), ...)), see parseGradient
+    *_stateFields("background_linear_gradient", (tuple, NoneType), None, "gradient", "paint"),
+    *_stateFields("foreground_linear_gradient", (tuple, NoneType), None, "gradient", "paint"),
 
-        self.border_width_default  = kwargs.get("border_width_default",  0)
-        self.border_width_pressed  = kwargs.get("border_width_pressed",  0)
-        self.border_width_hover    = kwargs.get("border_width_hover",    0)
-        self.border_width_disabled = kwargs.get("border_width_disabled", 0)
+    # ---------------------- borders ---------------------- #
 
-        # ---------------------- corners ---------------------- #
+    *_stateFields("border_colour", tuple, (0, 0, 0), "border", "paint"),
+    *_stateFields("border_width", int, 0, "border", "layout", dip=True),
 
-        self.corner_radius_default  = kwargs.get("corner_radius_default",  0)
-        self.corner_radius_pressed  = kwargs.get("corner_radius_pressed",  0)
-        self.corner_radius_hover    = kwargs.get("corner_radius_hover",    0)
-        self.corner_radius_disabled = kwargs.get("corner_radius_disabled", 0)
+    # ---------------------- corners ---------------------- #
 
-        # ---------------------- images ---------------------- #
+    *_stateFields("corner_radius", (int, float), 0, "corner", "paint", dip=True),
 
-        self.image_default  = kwargs.get("image_default",  None)
-        self.image_pressed  = kwargs.get("image_pressed",  None)
-        self.image_hover    = kwargs.get("image_hover",    None)
-        self.image_disabled = kwargs.get("image_disabled", None)
+    # ---------------------- images ---------------------- #
 
-        self.image_channels_default  = kwargs.get("image_channels_default",  (1.0, 1.0, 1.0, 1.0))
-        self.image_channels_pressed  = kwargs.get("image_channels_pressed",  (1.0, 1.0, 1.0, 1.0))
-        self.image_channels_hover    = kwargs.get("image_channels_hover",    (1.0, 1.0, 1.0, 1.0))
-        self.image_channels_disabled = kwargs.get("image_channels_disabled", (1.0, 1.0, 1.0, 1.0))
+    *_stateFields("image", object, None, "image", "paint"),
+    *_stateFields("image_channels", tuple, (1.0, 1.0, 1.0, 1.0), "image", "paint"),
+    *_stateFields("image_size", tuple, (0, 0), "image", "layout", dip=True),
+    ConfigField("image_text_separation", (int, NoneType), None, "image", "layout", dip=True),
+    ConfigField("image_text_side", str, "right", "image", "layout"),
+    ConfigField("image_use_max_dimensions", bool, True, "image", "paint"),
 
-        self.image_size_default  = kwargs.get("image_size_default",  (0, 0))
-        self.image_size_pressed  = kwargs.get("image_size_pressed",  (0, 0))
-        self.image_size_hover    = kwargs.get("image_size_hover",    (0, 0))
-        self.image_size_disabled = kwargs.get("image_size_disabled", (0, 0))
+    # ---------------- checkbox and switch ---------------- #
 
-        self.image_text_separation = kwargs.get("image_text_separation", None)
-        self.image_text_side       = kwargs.get("image_text_side", "right")
+    ConfigField("checkbox_width", (int, NoneType), None, "checkbox", "layout", dip=True),
+    ConfigField("checkbox_height", (int, NoneType), None, "checkbox", "layout", dip=True),
+    ConfigField("checkbox_active_deflate", int, 5, "checkbox", "paint"),
+    ConfigField("checkbox_text_separation", int, 5, "checkbox", "layout"),
+    ConfigField("checkbox_text_side", str, "right", "checkbox", "layout"),
+    *_stateFields("background_colour_active", tuple, (0, 0, 255), "checkbox", "paint"),
+    *_stateFields("foreground_colour_active", tuple, (0, 0, 255), "checkbox", "paint"),
+    ConfigField("switch_appearance", bool, False, "switch", "layout"),
+    ConfigField("switch_rounded", bool, False, "switch", "paint"),
+    ConfigField("switch_width", (int, NoneType), None, "switch", "layout", dip=True),
+    ConfigField("switch_height", (int, NoneType), None, "switch", "layout", dip=True),
+    ConfigField("switch_radius", (int, float), 0, "switch", "paint", dip=True),
+    ConfigField("switch_selector_padding", int, 0, "switch", "paint", dip=True),
+    ConfigField("switch_selector_border_colour", tuple, (150, 150, 150), "switch", "paint"),
+    ConfigField("switch_selector_border_width", int, 0, "switch", "paint", dip=True),
 
-        self.image_use_max_dimensions = kwargs.get("image_use_max_dimensions", True)
+    # -------------------- radiobutton -------------------- #
 
-        # ---------------- checkbox and switch ---------------- #
+    ConfigField("radiobutton_diameter", int, 0, "radiobutton", "layout", dip=True),
 
-        self.checkbox_width  = kwargs.get("checkbox_width",  None)
-        self.checkbox_height = kwargs.get("checkbox_height", None)
+    # ---------------------- combobox ------------------------ #
 
-        self.checkbox_active_deflate = kwargs.get("checkbox_active_deflate", 5)
-        
-        self.checkbox_text_separation = kwargs.get("checkbox_text_separation", 5)
-        self.checkbox_text_side       = kwargs.get("checkbox_text_side", "right")
+    ConfigField("arrow_width", (int, NoneType), None, "combobox", "layout", dip=True),
+    ConfigField("arrow_height", (int, NoneType), None, "combobox", "layout", dip=True),
+    ConfigField("arrow_colour", (tuple, NoneType), None, "combobox", "paint"),
+    ConfigField("arrow_text_separation", (int, NoneType), None, "combobox", "layout", dip=True),
+    ConfigField("arrow_text_side", str, "right", "combobox", "layout"),
 
-        self.background_colour_active_default  = kwargs.get("background_colour_active_default",  (0, 0, 255))
-        self.background_colour_active_pressed  = kwargs.get("background_colour_active_pressed",  (0, 0, 255))
-        self.background_colour_active_hover    = kwargs.get("background_colour_active_hover",    (0, 0, 255))
-        self.background_colour_active_disabled = kwargs.get("background_colour_active_disabled", (0, 0, 255))
+    # ---------------------- scrollbar ------------------------ #
 
-        self.foreground_colour_active_default  = kwargs.get("foreground_colour_active_default",  (0, 0, 255))
-        self.foreground_colour_active_pressed  = kwargs.get("foreground_colour_active_pressed",  (0, 0, 255))
-        self.foreground_colour_active_hover    = kwargs.get("foreground_colour_active_hover",    (0, 0, 255))
-        self.foreground_colour_active_disabled = kwargs.get("foreground_colour_active_disabled", (0, 0, 255))
+    ConfigField("scrollX", bool, True, "scrollbar", "structural"),
+    ConfigField("scrollY", bool, True, "scrollbar", "structural"),
+    ConfigField("scrollUnitsX", int, 15, "scrollbar", "structural"),
+    ConfigField("scrollUnitsY", int, 15, "scrollbar", "structural"),
+    ConfigField("scrollbar_type", str, "rectangular", "scrollbar", "paint"),
+    ConfigField("scrollbar_width", (int, NoneType), None, "scrollbar", "structural", dip=True),
+    ConfigField("scrollbar_padding", (int, NoneType), None, "scrollbar", "structural", dip=True),
+    # scroll on every motion event while dragging a thumb, instead of
+    # once per frame to the latest pointer position
+    ConfigField("scrollbar_drag_immediate", bool, False, "scrollbar", "paint"),
 
-        self.switch_appearance = kwargs.get("switch_appearance", False)
-        self.switch_rounded    = kwargs.get("switch_rounded",    False)
-        self.switch_width      = kwargs.get("switch_width",      None)
-        self.switch_height     = kwargs.get("switch_height",     None)
-        self.switch_radius     = kwargs.get("switch_radius",     0)
-        
-        self.switch_selector_padding       = kwargs.get("switch_selector_padding",       0)
-        self.switch_selector_border_colour = kwargs.get("switch_selector_border_colour", (150, 150, 150))
-        self.switch_selector_border_width  = kwargs.get("switch_selector_border_width",  0)
+    # ----------------------- other ----------------------- #
 
-        # -------------------- radiobutton -------------------- #
+    ConfigField("padding_all_sides", (int, NoneType), None, "other", "structural", dip=True),
 
-        self.radiobutton_diameter = kwargs.get("radiobutton_diameter", 0)
+    # ---------------------- rendering ---------------------- #
 
-        # ---------------------- combobox ------------------------ #
+    # paint each visual state once into a bitmap and blit it afterwards
+    ConfigField("render_retained_bitmap", bool, False, "render", "paint"),
+    # compose rounded rectangles from a shared nine-slice skin
+    ConfigField("render_nine_slice", bool, False, "render", "paint"),
+)
 
-        self.arrow_width  = kwargs.get("arrow_width",  None)
-        self.arrow_height = kwargs.get("arrow_height", None)
-        self.arrow_colour = kwargs.get("arrow_colour", None)
-        self.arrow_text_separation = kwargs.get("arrow_text_separation", None)
-        self.arrow_text_side       = kwargs.get("arrow_text_side", "right")
+FIELDS = {field.name: field for field in CONFIG_FIELDS}
 
-        # ---------------------- scrollbar ------------------------ #
+FIELD_NAMES = frozenset(FIELDS)
 
-        self.scrollX = kwargs.get("scrollX", True)
-        self.scrollY = kwargs.get("scrollY", True)
-        self.scrollUnitsX = kwargs.get("scrollUnitsX", 15)
-        self.scrollUnitsY = kwargs.get("scrollUnitsY", 15)
-        self.scrollbar_type = kwargs.get("scrollbar_type", "rectangular")
-        self.scrollbar_width = kwargs.get("scrollbar_width", None)
-        self.scrollbar_padding = kwargs.get("scrollbar_padding", None)
+DIP_FIELDS = frozenset(field.name for field in CONFIG_FIELDS if field.dip)
 
-        # ----------------------- other ----------------------- #
+EFFECTS = ("paint", "layout", "structural") # from least to most work
+
+
+def scaleDipValue(value, ratio:float):
+    """Scales a dip field value (a length or a tuple of lengths)."""
+    if isinstance(value, tuple):
+        return tuple(scaleDipValue(item, ratio) for item in value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if isinstance(value, int):
+        return int(value * ratio + 0.5)
+    return value * ratio
+
+
+def getChangeEffect(fields) -> str:
+    """Returns the effect of the changed fields that needs the most
+    work, or None if no field changed."""
+    effects = {FIELDS[name].effect for name in fields if name in FIELDS}
+    for effect in reversed(EFFECTS):
+        if effect in effects:
+            return effect
+    return None
+
+
+class CustomConfig:
 
-        self.padding_all_sides = kwargs.get("padding_all_sides", None)
+    __slots__ = tuple(field.name for field in CONFIG_FIELDS) + ("_compiledStyles", "_revision", "_subscribers", "_readOnly")
+
+    # when strict, unknown keys raise a KeyError instead of printing a
+    # warning. changed through CustomConfig.SetStrict().
+    _Strict = False
+
+    def __init__(self, **kwargs):
 
         # ----------- warn user if wrong arguments ----------- #
 
-        self.__CheckWrongArguments(kwargs)
+        if not (kwargs.keys() <= FIELD_NAMES):
+            self._checkKeys(kwargs)
+
+        # --------------- set defaults and values --------------- #
+
+        # slots are written through their descriptors, skipping
+        # __setattr__ (there is nothing to invalidate yet).
+        get = kwargs.get
+        for name, setter, default in _SLOT_SETTERS:
+            setter(self, get(name, default))
+        _setCompiledStyles(self, None)
+        _setRevision(self, 0)
+        _setSubscribers(self, None)
+        _setReadOnly(self, False)
+
+
+    @classmethod
+    def SetStrict(cls, strict:bool=True):
+        """In strict mode, unknown keys raise a KeyError."""
+        cls._Strict = strict
 
 
-    def __CheckWrongArguments(self, kwargs:dict):
+    @classmethod
+    def _checkKeys(cls, kwargs:dict):
         # checks if the user entered a wrong argument
-        attributes = self.__dict__.keys()
-        for key in kwargs.keys():
-            if key not in attributes:
-                print(f"CustomConfig::Key \"{key}\" not in attributes.")
+        unknown = kwargs.keys() - FIELD_NAMES
+        if not unknown:
+            return
+        if cls._Strict:
+            raise KeyError(f"CustomConfig::Unknown keys {sorted(unknown)}.")
+        for key in unknown:
+            print(f"CustomConfig::Key \"{key}\" not in attributes.")
+
+
+    def __setattr__(self, name, value):
+        if self._readOnly and not name.startswith("_"):
+            raise AttributeError("CustomConfig::Config is read-only, use a copy.")
+        # writing the current value changes nothing, so nothing is
+        # invalidated or repainted
+        if not name.startswith("_") and (getattr(self, name, _MISSING) == value):
+            return
+        object.__setattr__(self, name, value)
+        # public attributes are drawing fields, so the compiled styles
+        # of this config are no longer valid.
+        if not name.startswith("_"):
+            _setCompiledStyles(self, None)
+            _setRevision(self, self._revision + 1)
+            if self._subscribers:
+                scheduleConfigRepaint(self, name)
+
+
+    def __copy__(self):
+        config = CustomConfig.__new__(CustomConfig)
+        for getter, setter in _SLOT_ACCESSORS:
+            setter(config, getter(self))
+        _setSubscribers(config, None) # the copy starts without subscribers
+        _setReadOnly(config, False)
+        return config
+
+
+    def SetReadOnly(self, readOnly:bool=True):
+        """Read-only configs (such as the shared default configs) raise
+        an AttributeError when modified."""
+        self._readOnly = readOnly
+
+
+    def IsReadOnly(self) -> bool:
+        return self._readOnly
+
+
+    def Subscribe(self, subscriber):
+        """Registers an object (weakly) to be notified through
+        _onSharedConfigChanged(fields) after this config changes."""
+        if self._subscribers is None:
+            self._subscribers = weakref.WeakSet()
+        self._subscribers.add(subscriber)
+
+
+    def Unsubscribe(self, subscriber):
+        if self._subscribers is not None:
+            self._subscribers.discard(subscriber)
+
+
+    def GetSubscribers(self) -> list:
+        return list(self._subscribers) if self._subscribers else []
+
+
+    def Update(self, **kwargs):
+        """Updates existing attributes. Unknown keys are reported (or
+        raised in strict mode) and skipped."""
+        if not (kwargs.keys() <= FIELD_NAMES):
+            self._checkKeys(kwargs)
+            kwargs = {key: value for key, value in kwargs.items() if key in FIELD_NAMES}
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+    def ToDict(self) -> dict:
+        """Returns a {field: value} dictionary of all the fields."""
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+    @classmethod
+    def FromDict(cls, values:dict) -> "CustomConfig":
+        """Creates a config from a dictionary. Lists are converted to
+        tuples, so dictionaries loaded from json can be used."""
+        return cls(**{key: _toTuple(value) for key, value in values.items()})
+
+
+# descriptors used for fast construction and copying
+_SLOT_SETTERS = tuple((field.name, CustomConfig.__dict__[field.name].__set__, field.default)
+                      for field in CONFIG_FIELDS)
+_SLOT_ACCESSORS = tuple((CustomConfig.__dict__[name].__get__, CustomConfig.__dict__[name].__set__)
+                        for name in CustomConfig.__slots__ if (name != "_subscribers"))
+_setCompiledStyles = CustomConfig.__dict__["_compiledStyles"].__set__
+_setRevision = CustomConfig.__dict__["_revision"].__set__
+_setSubscribers = CustomConfig.__dict__["_subscribers"].__set__
+_setReadOnly = CustomConfig.__dict__["_readOnly"].__set__
+
+
+class CustomConfigOverlay:
+    """Copy-on-write view of a CustomConfig. Attribute reads fall
+    through to the shared base config, while writes are stored in a
+    small overrides dictionary, so the base config is never mutated."""
+
+    __slots__ = ("_Base", "_Overrides", "_OwnCompiledStyles", "_OwnCompiledRevision", "_ReadOnly")
+
+    def __init__(self, base:CustomConfig, **kwargs):
+
+        # overlays are flattened so reads never go through more than
+        # one level.
+        if isinstance(base, CustomConfigOverlay):
+            overrides = dict(base._Overrides)
+            base = base._Base
+        else:
+            overrides = {}
+        if not (kwargs.keys() <= FIELD_NAMES):
+            CustomConfig._checkKeys(kwargs)
+            kwargs = {key: value for key, value in kwargs.items() if key in FIELD_NAMES}
+        overrides.update(kwargs)
+
+        object.__setattr__(self, "_Base", base)
+        object.__setattr__(self, "_Overrides", overrides)
+        object.__setattr__(self, "_OwnCompiledStyles", None)
+        object.__setattr__(self, "_OwnCompiledRevision", None)
+        object.__setattr__(self, "_ReadOnly", False)
+
+
+    def __getattr__(self, name):
+        # only called for names that are not slots or methods of the
+        # overlay. only config fields are read from the base, so the
+        # methods of the shared base are never reached through it.
+        if name not in FIELD_NAMES:
+            raise AttributeError(f"CustomConfigOverlay::No attribute \"{name}\".")
+        try:
+            return self._Overrides[name]
+        except KeyError:
+            return getattr(self._Base, name)
+
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        elif name in FIELD_NAMES:
+            if self._ReadOnly:
+                raise AttributeError("CustomConfigOverlay::Config is read-only.")
+            if getattr(self, name) == value:
+                return
+            self._Overrides[name] = value
+            object.__setattr__(self, "_OwnCompiledStyles", None)
+        else:
+            CustomConfig._checkKeys({name: value})
+
+
+    def __copy__(self):
+        return CustomConfigOverlay(self)
+
+
+    @property
+    def _compiledStyles(self):
+        # without overrides the overlay looks exactly like its base, so
+        # the compiled styles of the base are shared.
+        if not self._Overrides:
+            return self._Base._compiledStyles
+        if self._OwnCompiledRevision != self._Base._revision:
+            return None
+        return self._OwnCompiledStyles
+
+
+    @_compiledStyles.setter
+    def _compiledStyles(self, styles):
+        if not self._Overrides:
+            self._Base._compiledStyles = styles
+        else:
+            object.__setattr__(self, "_OwnCompiledStyles", styles)
+            object.__setattr__(self, "_OwnCompiledRevision", self._Base._revision)
+
 
-        
     def Update(self, **kwargs):
-        """Updates existing attributes (or creates them if
-        non-existent)."""
+        """Stores the values as overrides of the base config."""
         for key, value in kwargs.items():
             setattr(self, key, value)
 
-        
 
-        
+    def GetBase(self) -> CustomConfig:
+        return self._Base
+
+
+    def ToDict(self) -> dict:
+        """Returns a {field: value} dictionary of all the fields, with
+        the overrides applied."""
+        return {**self._Base.ToDict(), **self._Overrides}
+
+
+    def SetReadOnly(self, readOnly:bool=True):
+        """Makes the overrides read-only. The shared base config is not
+        affected."""
+        object.__setattr__(self, "_ReadOnly", readOnly)
+
+
+    def IsReadOnly(self) -> bool:
+        return self._ReadOnly
+
+
+    def GetOverrides(self) -> dict:
+        return dict(self._Overrides)
+
+
+    def Materialize(self) -> CustomConfig:
+        """Returns an independent CustomConfig with the overrides
+        applied."""
+        config = copy(self._Base)
+        config.Update(**self._Overrides)
+        return config
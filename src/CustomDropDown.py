@@ -70,8 +70,8 @@ class CustomDropDown(wx.PopupTransientWindow, CustomObject):
         # events)
         #self._ChoiceRectangles = {}
 
-        self._PaddingHorizontal = dip(14)
-        self._PaddingVertical = dip(7)
+        self._PaddingHorizontal = dip(14, window=self)
+        self._PaddingVertical = dip(7, window=self)
 
         self.SetInitialSize(size)
 
@@ -34,19 +34,19 @@ class CustomPanel(wx.Panel, CustomObject):
         self._config.background_colour_default = (colour.GetRed(),
                                                   colour.GetGreen(),
                                                   colour.GetBlue())
-        self.Refresh()
+        self._requestRefresh()
 
 
     def SetBorderColour(self, colour:wx.Colour):
         self._config.border_colour_default = (colour.GetRed(),
                                               colour.GetGreen(),
                                               colour.GetBlue())
-        self.Refresh()
+        self._requestRefresh()
 
 
     def SetBorderWidth(self, width:int):
         self._config.border_width_default = width
-        self.Refresh()
+        self._requestRefresh()
 
 
     def GetBackgroundColour(self):
@@ -65,7 +65,7 @@ class CustomPanel(wx.Panel, CustomObject):
 
         # drawing area background
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
         
         # ------------------- pen and brush ------------------- #
@@ -74,19 +74,22 @@ class CustomPanel(wx.Panel, CustomObject):
         # behavior. it has only a "default" state.
         drawing_properties = self._getStateDrawingProperties("default", gc)
 
-        pen = drawing_properties["pen"]
-        gcdc.SetPen(pen)        
-        gc.SetBrush(drawing_properties["brush_background"])
+        pen = drawing_properties.pen
         
         # ----------- drawing the panel's rectangle ----------- #
 
         panelRect = controlRect.Deflate(pen.GetWidth(),
                                         pen.GetWidth())
         
-        gcdc.DrawRoundedRectangle(panelRect, radius=self._config.corner_radius_default)
+        if not self._drawNineSlice(gc, drawing_properties, panelRect, self._config.corner_radius_default):
+            gcdc.SetPen(pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
+            gcdc.DrawRoundedRectangle(panelRect, radius=self._config.corner_radius_default)
 
 
     def __OnSize(self, event):
-        self.Refresh()
+        # the paint insets the background by the pen width (even for a
+        # transparent pen), so the old edges must always be repainted
+        self._requestRefresh()
         event.Skip()
         
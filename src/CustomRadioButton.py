@@ -50,6 +50,11 @@ class CustomRadioButton(CustomControl):
 
     def __OnPaint(self, event):
 
+        # ------------------ retained bitmap ------------------ #
+
+        if self._paintRetainedBitmap():
+            return
+
         # --------------------- contexts --------------------- #
         
         gcdc, gc = self._getDrawingContexts()
@@ -58,16 +63,12 @@ class CustomRadioButton(CustomControl):
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # ---------------------- cursor ---------------------- #
-        
-        self.SetCursor(drawing_properties["cursor"])
-
         # ------------ drawing area and background ------------ #
 
         controlRect:wx.Rect = self.GetClientRect() # control area
 
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
 
         # ------------------ get dimensions ------------------ #
@@ -100,10 +101,10 @@ class CustomRadioButton(CustomControl):
         # draw background for selector depending on state
         if self._Value:
             gcdc.SetPen(wx.TRANSPARENT_PEN)
-            gc.SetBrush(wx.Brush(wx.Colour(drawing_properties["background_colour_active"])))
+            gc.SetBrush(drawing_properties.brush_background_active)
         else:
-            gcdc.SetPen(drawing_properties["pen"])
-            gc.SetBrush(drawing_properties["brush_background"])
+            gcdc.SetPen(drawing_properties.pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
 
         # calculate the center of the radiobutton circle
         radiobuttonCenterX = radiobuttonRectangle.GetX() + self._config.radiobutton_diameter//2
@@ -111,19 +112,16 @@ class CustomRadioButton(CustomControl):
         gcdc.DrawCircle(radiobuttonCenterX, radiobuttonCenterY, self._config.radiobutton_diameter//2)
 
         if self._Value:
-            gc.SetBrush(drawing_properties["brush_foreground"])
+            gc.SetBrush(self._getFillBrush(drawing_properties, "foreground"))
             gcdc.DrawCircle(radiobuttonCenterX, radiobuttonCenterY, self._config.radiobutton_diameter//5)
             
 
     def DoGetBestClientSize(self) -> wx.Size:
 
-        dc = wx.ClientDC(self)
-        gcdc:wx.GCDC = wx.GCDC(dc)
-
-        textWidth, textHeight = self._getDefaultTextExtent(gcdc, self._Label)
+        textWidth, textHeight = self._getDefaultTextExtent(self._Label)
         imageWidth, imageHeight = self._getMaxDimensions("image")
         sidePadding = self._getMaxDimensions("border_width")
-        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6)
+        text_separation = self._config.image_text_separation if self._config.image_text_separation else dip(6, window=self)
         textImageWidth, textImageHeight = self._getObjectSideDimensions(imageWidth, imageHeight,
                                                                         textWidth, textHeight,
                                                                         text_separation,
@@ -141,14 +139,16 @@ class CustomRadioButton(CustomControl):
 
     def __OnLeftDown(self, event):
         if not self._Pressed:
+            oldState = self.GetStateAsString()
             self.CaptureMouse()
             self._Pressed = True
-            self.Refresh()
+            self._onStateChanged(oldState)
         event.Skip()
 
 
     def __OnLeftUp(self, event):
         if self._Pressed:
+            oldState = self.GetStateAsString()
             self.ReleaseMouse()
             self._Pressed = False
             if self._Hover:
@@ -156,10 +156,11 @@ class CustomRadioButton(CustomControl):
                 for rb in CustomRadioButton.groups[self.group_id]:
                     if rb._Value:
                         rb._Value = False
-                        rb.Refresh()
+                        rb._requestRefresh()
                 # set the value of this radiobutton to true
                 self._Value = True
                 wx.PostEvent(self, wx.PyCommandEvent(wx.EVT_RADIOBUTTON.typeId, self.GetId()))
-            self.Refresh()
+                self._requestRefresh() # the value changed
+            self._onStateChanged(oldState)
         event.Skip()
 
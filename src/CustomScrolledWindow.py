@@ -7,6 +7,7 @@
 import wx
 from copy import copy
 from .utils.dip import dip
+from .utils.repaintQueue import requestFrameCallback
 from .base._CustomObject import CustomObject
 from wx.lib.scrolledpanel import ScrolledPanel
 
@@ -28,6 +29,12 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         self._HorizontalBarTopY = 0
         self._HorizontalBarHeight = 0
 
+        # scrollbar window -> (size, brush, bitmap) of its track
+        self._ScrollbarTracks = {}
+
+        # (scrollbar window, x, y) of the thumb drag not applied yet
+        self._DragPosition = None
+
         self._Enabled = True ###
         self._Pressed = False
         self._Hover = False
@@ -57,8 +64,8 @@ class CustomScrolledWindow(wx.Window, CustomObject):
 
         # ---------------- default values ---------------- #
         
-        self._ScrollbarWidth = self._config.scrollbar_width if self._config.scrollbar_width else dip(15)
-        self._ScrollbarPadding = self._config.scrollbar_padding if self._config.scrollbar_padding else dip(3)
+        self._ScrollbarWidth = self._config.scrollbar_width if self._config.scrollbar_width else dip(15, window=self)
+        self._ScrollbarPadding = self._config.scrollbar_padding if self._config.scrollbar_padding else dip(3, window=self)
 
         # -------------- scrollbar windows -------------- #
         
@@ -151,6 +158,131 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         self._sizer.Layout()
 
 
+    def _rebuildStructure(self, fields:set):
+        """Applies changes to the scrolling and scrollbar fields."""
+        if fields & {"scrollX", "scrollY", "scrollUnitsX", "scrollUnitsY"}:
+            self._scrolledPanel.SetupScrolling(self._config.scrollX,
+                                               self._config.scrollY,
+                                               self._config.scrollUnitsX,
+                                               self._config.scrollUnitsY,
+                                               scrollToTop=False)
+            self._scrolledPanel.ShowScrollbars(wx.SHOW_SB_NEVER, wx.SHOW_SB_NEVER)
+        if fields & {"scrollbar_width", "scrollbar_padding"}:
+            self._ScrollbarWidth = self._config.scrollbar_width if self._config.scrollbar_width else dip(15, window=self)
+            self._ScrollbarPadding = self._config.scrollbar_padding if self._config.scrollbar_padding else dip(3, window=self)
+            self._VerticalScrollbar.SetMinSize((self._ScrollbarWidth, -1))
+            self._HorizontalScrollbar.SetMinSize((-1, self._ScrollbarWidth))
+        self.UpdateScrollbars()
+        self._requestRefresh(self._VerticalScrollbar)
+        self._requestRefresh(self._HorizontalScrollbar)
+
+
+    def _applyStateCursor(self):
+        # the states belong to the scrollbars
+        cursor = self._getStateDrawingProperties(self.GetStateAsString()).cursor
+        self._VerticalScrollbar.SetCursor(cursor)
+        self._HorizontalScrollbar.SetCursor(cursor)
+
+
+    # ------------------- thumb and track ------------------- #
+
+
+    def _updateThumb(self, scrollbarWindow:wx.Window) -> wx.Rect:
+        """Calculates the thumb of the scrollbar from the scroll position
+        of the panel. The rectangle is saved to check if the user clicks
+        on it."""
+        axis = 1 if (scrollbarWindow == self._VerticalScrollbar) else 0
+
+        # the virtual size is the size of the complete panel. the
+        # client size is the size of the panel that we see.
+        real = self._scrolledPanel.GetVirtualSize()[axis]
+        visible = self._scrolledPanel.GetClientSize()[axis]
+
+        # calculate the proportion and scale it
+        barHeight = (visible / real) * scrollbarWindow.GetClientSize()[axis]
+
+        # CalcScrolledPosition translates logical coordinates to
+        # device ones. logical coordinates are independent of the
+        # screen. device coordinates are the ones used by the screen
+        # (pixels)
+
+        # we need to translate the scrolled logical coordinates to
+        # device ones, and then scale the device ones to match our
+        # view of the scrollbar.
+        fromTheTop = self._scrolledPanel.CalcScrolledPosition(0, 0)
+        topOfBar = -fromTheTop[axis] * (visible / real)
+
+        if axis:
+            self._VerticalBarHeight = barHeight
+            self._VerticalBarTopY = topOfBar
+            self._VerticalScrollbarRectangle = wx.Rect(0, int(topOfBar),
+                                                       self._ScrollbarWidth, int(barHeight))
+            return self._VerticalScrollbarRectangle
+        self._HorizontalBarHeight = barHeight
+        self._HorizontalBarTopY = topOfBar
+        self._HorizontalScrollbarRectangle = wx.Rect(int(topOfBar), 0,
+                                                     int(barHeight), self._ScrollbarWidth)
+        return self._HorizontalScrollbarRectangle
+
+
+    def _getThumbMargin(self, *states) -> int:
+        """Returns how far the thumb border of the states reaches
+        outside the thumb rectangle (plus antialiasing)."""
+        return max(self._getStateDrawingProperties(state).pen.GetWidth() for state in states) + 1
+
+
+    def _refreshThumb(self, scrollbarWindow:wx.Window):
+        """Invalidates the old and new positions of the thumb after
+        scrolling, instead of the whole scrollbar."""
+        oldThumb = wx.Rect(self._VerticalScrollbarRectangle if (scrollbarWindow == self._VerticalScrollbar)
+                           else self._HorizontalScrollbarRectangle)
+        newThumb = self._updateThumb(scrollbarWindow)
+        margin = self._getThumbMargin(self.GetStateAsString())
+        self._requestRefresh(scrollbarWindow, oldThumb.Union(newThumb).Inflate(margin, margin))
+
+
+    def _getStateChangeRect(self, scrollbarWindow:wx.Window, oldState:str) -> wx.Rect:
+        """Returns the part of the scrollbar to repaint after the state
+        changed: only the thumb if the track looks the same in both
+        states, or None for the whole scrollbar."""
+        newState = self.GetStateAsString()
+        old = self._getStateDrawingProperties(oldState)
+        new = self._getStateDrawingProperties(newState)
+        if (old.brush_background is not new.brush_background) or (old.background_gradient != new.background_gradient):
+            return None
+        margin = self._getThumbMargin(oldState, newState)
+        return wx.Rect(self._updateThumb(scrollbarWindow)).Inflate(margin, margin)
+
+
+    @staticmethod
+    def _getUpdateBox(scrollbarWindow:wx.Window) -> wx.Rect:
+        """Returns the invalidated rectangle of the window being painted,
+        or None if the whole window has to be painted."""
+        box = scrollbarWindow.GetUpdateRegion().GetBox()
+        return None if box.IsEmpty() else box
+
+
+    def _drawTrack(self, gcdc:wx.GCDC, drawing_properties, scrollbarWindow:wx.Window):
+        """Draws the track of the scrollbar from a bitmap that is kept
+        until the size or the background brush of the track change."""
+        size = tuple(scrollbarWindow.GetClientSize())
+        if not all(size):
+            return
+        brush = self._getFillBrush(drawing_properties, "background", scrollbarWindow)
+        track = self._ScrollbarTracks.get(scrollbarWindow)
+        if (track is None) or (track[0] != size) or (track[1] is not brush):
+            bitmap = wx.Bitmap(*size)
+            dc = wx.MemoryDC(bitmap)
+            trackDC = wx.GCDC(dc)
+            trackDC.SetPen(wx.TRANSPARENT_PEN)
+            trackDC.GetGraphicsContext().SetBrush(brush)
+            trackDC.DrawRectangle(0, 0, *size)
+            del trackDC
+            dc.SelectObject(wx.NullBitmap)
+            track = self._ScrollbarTracks[scrollbarWindow] = (size, brush, bitmap)
+        gcdc.DrawBitmap(track[2], 0, 0)
+
+
     def GetPanel(self):
         """Returns the scrolled panel to the user."""
         return self._scrolledPanel
@@ -179,8 +311,10 @@ class CustomScrolledWindow(wx.Window, CustomObject):
             event.Skip()
             return
         
+        oldState = self.GetStateAsString()
         self._Pressed = True
         scrollbarWindow.CaptureMouse()
+        self._onStateChanged(oldState, scrollbarWindow, lambda: self._getStateChangeRect(scrollbarWindow, oldState))
 
         # mouse click offset calculation
         if (scrollbarWindow == self._VerticalScrollbar):
@@ -194,10 +328,12 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         """Releases the mouse capture when click is up."""
         scrollbarWindow = event.GetEventObject()
         if scrollbarWindow.HasCapture():
+            self._applyDrag() # the thumb ends where it was released
+            oldState = self.GetStateAsString()
             scrollbarWindow.ReleaseMouse()
             self._Pressed = False
             self._Hover = False
-            scrollbarWindow.Refresh()
+            self._onStateChanged(oldState, scrollbarWindow, lambda: self._getStateChangeRect(scrollbarWindow, oldState))
         event.Skip()
 
     
@@ -205,9 +341,10 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         """Handles the hover attribute when the mouse leaves the scrollbar window."""
         scrollbarWindow = event.GetEventObject()
         if not scrollbarWindow.HasCapture():
+            oldState = self.GetStateAsString()
             self._Pressed = False
             self._Hover = False
-            scrollbarWindow.Refresh()
+            self._onStateChanged(oldState, scrollbarWindow, lambda: self._getStateChangeRect(scrollbarWindow, oldState))
         event.Skip()
             
 
@@ -220,89 +357,101 @@ class CustomScrolledWindow(wx.Window, CustomObject):
 
         if scrollbarWindow.HasCapture():
 
-            unitsX, unitsY = self._scrolledPanel.GetScrollPixelsPerUnit()
+            # only the latest pointer position is kept, and the panel
+            # is scrolled to it once per frame
+            self._DragPosition = (scrollbarWindow, x, y)
+            if self._config.scrollbar_drag_immediate:
+                self._applyDrag()
+            else:
+                requestFrameCallback(self._applyDrag)
 
-            # --------------------- plan --------------------- #
+        else:
+
+            if (scrollbarWindow == self._VerticalScrollbar):
+                rectangle = self._VerticalScrollbarRectangle
+            elif (scrollbarWindow == self._HorizontalScrollbar):
+                rectangle = self._HorizontalScrollbarRectangle
+
+            oldState = self.GetStateAsString()
+            self._Hover = rectangle.Contains(x, y)
+            self._onStateChanged(oldState, scrollbarWindow, lambda: self._getStateChangeRect(scrollbarWindow, oldState))
             
-            # viewStart -> scroll Units
-            # viewStart * scroll Units -> view start in pixels
+        event.Skip()
 
-            # viewStartPX / scroll Units -> viewStart
 
-            # transform bar height into percentage of virtual size to
-            # calculate max scroll range (to bottom of scrolled
-            # panel).  virtual size -> 100% bar height -> 20%
+    def _applyDrag(self):
+        """Scrolls the panel to the latest pointer position of the thumb
+        drag."""
+        if not self or (self._DragPosition is None): # destroyed or applied
+            return
+        scrollbarWindow, x, y = self._DragPosition
+        self._DragPosition = None
 
-            # transform range
-            # 10 y in verticalscrollbar -> 40 view start in pixels
+        unitsX, unitsY = self._scrolledPanel.GetScrollPixelsPerUnit()
 
-            # bottom of range -> 100% of virtual size range (not of
-            # scrolled panel, but of scrollable range)
+        # --------------------- plan --------------------- #
+        
+        # viewStart -> scroll Units
+        # viewStart * scroll Units -> view start in pixels
 
-            #y (vertical difference) -> x of virtual size
-            # then scroll to percentage of virtual size
+        # viewStartPX / scroll Units -> viewStart
 
-            # scrollbarAreaHeightPX -> scrolledPanelFullHeightPX
-            # verticalBarHeight -> px
-            # scrollableRangePX -> 100
-            # x -> y percentage
-            # calculate click position percentage on scrollbar area range
+        # transform bar height into percentage of virtual size to
+        # calculate max scroll range (to bottom of scrolled
+        # panel).  virtual size -> 100% bar height -> 20%
 
+        # transform range
+        # 10 y in verticalscrollbar -> 40 view start in pixels
 
+        # bottom of range -> 100% of virtual size range (not of
+        # scrolled panel, but of scrollable range)
 
-            if (scrollbarWindow == self._VerticalScrollbar):
-                if not self._config.scrollY:
-                    event.Skip()
-                    return
-                scrolledPanelFullHeightPX = self._scrolledPanel.GetVirtualSize()[1]
-                scrollbarAreaHeightPX = self._VerticalScrollbar.GetClientSize()[1]
-                scrollbarHeight = self._VerticalBarHeight
-                clickedIn = y + self._VerticalDifference
-                focus = unitsY
-            elif (scrollbarWindow == self._HorizontalScrollbar):
-                if not self._config.scrollX:
-                    event.Skip()
-                    return
-                scrolledPanelFullHeightPX = self._scrolledPanel.GetVirtualSize()[0]
-                scrollbarAreaHeightPX = self._HorizontalScrollbar.GetClientSize()[0]
-                scrollbarHeight = self._HorizontalBarHeight
-                clickedIn = x + self._HorizontalDifference
-                focus = unitsX
+        #y (vertical difference) -> x of virtual size
+        # then scroll to percentage of virtual size
 
-            transform = (scrollbarHeight * scrolledPanelFullHeightPX) // scrollbarAreaHeightPX
+        # scrollbarAreaHeightPX -> scrolledPanelFullHeightPX
+        # verticalBarHeight -> px
+        # scrollableRangePX -> 100
+        # x -> y percentage
+        # calculate click position percentage on scrollbar area range
 
-            # the very bottom cannot be scrolled down to
-            scrollableRangePX = scrolledPanelFullHeightPX - transform
 
-            scrollbarClickRange = scrollbarAreaHeightPX - int(scrollbarHeight)
 
-            percentage = clickedIn * 1 / scrollbarClickRange
+        if (scrollbarWindow == self._VerticalScrollbar):
+            if not self._config.scrollY:
+                return
+            scrolledPanelFullHeightPX = self._scrolledPanel.GetVirtualSize()[1]
+            scrollbarAreaHeightPX = self._VerticalScrollbar.GetClientSize()[1]
+            scrollbarHeight = self._VerticalBarHeight
+            clickedIn = y + self._VerticalDifference
+            focus = unitsY
+        elif (scrollbarWindow == self._HorizontalScrollbar):
+            if not self._config.scrollX:
+                return
+            scrolledPanelFullHeightPX = self._scrolledPanel.GetVirtualSize()[0]
+            scrollbarAreaHeightPX = self._HorizontalScrollbar.GetClientSize()[0]
+            scrollbarHeight = self._HorizontalBarHeight
+            clickedIn = x + self._HorizontalDifference
+            focus = unitsX
 
-            value = (percentage * scrollableRangePX) / focus
+        transform = (scrollbarHeight * scrolledPanelFullHeightPX) // scrollbarAreaHeightPX
 
-            # scroll
-            if (scrollbarWindow == self._VerticalScrollbar):
-                self._scrolledPanel.Scroll(-1, int(value))
-            elif (scrollbarWindow == self._HorizontalScrollbar):
-                self._scrolledPanel.Scroll(int(value), -1)
+        # the very bottom cannot be scrolled down to
+        scrollableRangePX = scrolledPanelFullHeightPX - transform
 
-            scrollbarWindow.Refresh()
+        scrollbarClickRange = scrollbarAreaHeightPX - int(scrollbarHeight)
 
-        else:
+        percentage = clickedIn * 1 / scrollbarClickRange
 
-            if (scrollbarWindow == self._VerticalScrollbar):
-                rectangle = self._VerticalScrollbarRectangle
-            elif (scrollbarWindow == self._HorizontalScrollbar):
-                rectangle = self._HorizontalScrollbarRectangle
+        value = (percentage * scrollableRangePX) / focus
 
-            if rectangle.Contains(x, y):
-                self._Hover = True
-                scrollbarWindow.Refresh()
-            else:
-                self._Hover = False
-                scrollbarWindow.Refresh()
-            
-        event.Skip()
+        # scroll
+        if (scrollbarWindow == self._VerticalScrollbar):
+            self._scrolledPanel.Scroll(-1, int(value))
+        elif (scrollbarWindow == self._HorizontalScrollbar):
+            self._scrolledPanel.Scroll(int(value), -1)
+
+        self._refreshThumb(scrollbarWindow)
 
 
     def __OnWheel(self, event:wx.MouseEvent):
@@ -317,17 +466,18 @@ class CustomScrolledWindow(wx.Window, CustomObject):
                 return
             x = currentView[0]
             y = currentView[1] - (event.GetWheelRotation() / 8)
-            #wx.CallAfter(self._VerticalScrollbar.Refresh)
-            self._VerticalScrollbar.Refresh()
+            scrollbarWindow = self._VerticalScrollbar
         elif event.GetWheelAxis() == wx.MOUSE_WHEEL_HORIZONTAL:
             if not self._config.scrollX:
                 return
             x = currentView[0] - (event.GetWheelRotation() / 8)
             y = currentView[1]
-            #wx.CallAfter(self._HorizontalScrollbar.Refresh)
-            self._HorizontalScrollbar.Refresh()
+            scrollbarWindow = self._HorizontalScrollbar
+        else:
+            return
 
         self._scrolledPanel.Scroll(int(x), int(y))
+        self._refreshThumb(scrollbarWindow)
 
 
     def __OnSize(self, event):
@@ -358,9 +508,10 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         elif (visibleH / realH < 1.0) and not self._HorizontalScrollbarShown:
             self._showHorizontalScrollbar(True)
 
-        self._scrolledPanel.Refresh()
-        self._VerticalScrollbar.Refresh()
-        self._HorizontalScrollbar.Refresh()
+        # the exposed parts of the panel are repainted by the system,
+        # but the thumbs are scaled to the new size
+        self._requestRefresh(self._VerticalScrollbar)
+        self._requestRefresh(self._HorizontalScrollbar)
 
         self._sizer.Layout()
 
@@ -383,58 +534,24 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         if (visibleY / realY >= 1.0):
             self._VerticalScrollbar.SetSize((0, 0))
 
-        # calculate the proportion
-        barHeight = visibleY / realY
-        # now we scale it
-        barHeight *= self._VerticalScrollbar.GetClientSize()[1]
-
-        self._VerticalBarHeight = barHeight
-
-        # CalcScrolledPosition translates logical coordinates to
-        # device ones. logical coordinates are independent of the
-        # screen. device coordinates are the ones used by the screen
-        # (pixels)
-
-        # we need to translate the scrolled logical coordinates to
-        # device ones, and then scale the device ones to match our
-        # view of the scrollbar.
-
-        fromTheTop = self._scrolledPanel.CalcScrolledPosition(0, 0)
-
-        topOfBarY = -fromTheTop[1] * (visibleY/realY)
-
-        # we will save this data
-        self._VerticalBarTopY = topOfBarY
-
+        self._updateThumb(self._VerticalScrollbar)
 
-        # create contexts
+        # create contexts (only the invalidated part is drawn)
 
-        gcdc, gc = self._getDrawingContexts(self._VerticalScrollbar)
+        gcdc, gc = self._getDrawingContexts(self._VerticalScrollbar, self._getUpdateBox(self._VerticalScrollbar))
 
         # drawing properties
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # cursor
+        # background
 
-        self._VerticalScrollbar.SetCursor(drawing_properties["cursor"])
-
-        # drawing area and background
-
-        controlRect:wx.Rect = self._VerticalScrollbar.GetClientRect()
-
-        gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gc.SetBrush(drawing_properties["brush_background"])
-        gcdc.DrawRectangle(controlRect)
+        self._drawTrack(gcdc, drawing_properties, self._VerticalScrollbar)
 
         # draw scroll rectangle
 
-        gcdc.SetPen(drawing_properties["pen"])
-        gc.SetBrush(drawing_properties["brush_foreground"])
-
-        # save the rectangle data to check if the user clicks on it
-        self._VerticalScrollbarRectangle = wx.Rect(0, int(topOfBarY),
-                                                   self._ScrollbarWidth, int(barHeight))
+        gcdc.SetPen(drawing_properties.pen)
+        gc.SetBrush(self._getFillBrush(drawing_properties, "foreground", self._VerticalScrollbar))
 
         if (self._config.scrollbar_type == "rectangular"):
             gc.DrawRectangle(self._VerticalScrollbarRectangle.GetX() + self._ScrollbarPadding,
@@ -468,58 +585,24 @@ class CustomScrolledWindow(wx.Window, CustomObject):
         if (visibleY / realY >= 1.0):
             self._HorizontalScrollbar.SetSize((0, 0))
 
-        # calculate the proportion
-        barHeight = visibleY / realY
-        # now we scale it
-        barHeight *= self._HorizontalScrollbar.GetClientSize()[0]
+        self._updateThumb(self._HorizontalScrollbar)
 
-        self._HorizontalBarHeight = barHeight
+        # create contexts (only the invalidated part is drawn)
 
-        # CalcScrolledPosition translates logical coordinates to
-        # device ones. logical coordinates are independent of the
-        # screen. device coordinates are the ones used by the screen
-        # (pixels)
-
-        # we need to translate the scrolled logical coordinates to
-        # device ones, and then scale the device ones to match our
-        # view of the scrollbar.
-
-        fromTheTop = self._scrolledPanel.CalcScrolledPosition(0, 0)
-
-        topOfBarY = -fromTheTop[0] * (visibleY/realY)
-
-        # we will save this data
-        self._HorizontalBarTopY = topOfBarY
-
-
-        # create contexts
-
-        gcdc, gc = self._getDrawingContexts(self._HorizontalScrollbar)
+        gcdc, gc = self._getDrawingContexts(self._HorizontalScrollbar, self._getUpdateBox(self._HorizontalScrollbar))
 
         # drawing properties
 
         drawing_properties = self._getStateDrawingProperties(self.GetStateAsString(), gc)
 
-        # cursor
-
-        self._VerticalScrollbar.SetCursor(drawing_properties["cursor"])
-
-        # drawing area and background
+        # background
 
-        controlRect:wx.Rect = self._HorizontalScrollbar.GetClientRect()
-
-        gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gc.SetBrush(drawing_properties["brush_background"])
-        gcdc.DrawRectangle(controlRect)
+        self._drawTrack(gcdc, drawing_properties, self._HorizontalScrollbar)
 
         # draw scroll rectangle
 
-        gcdc.SetPen(drawing_properties["pen"])
-        gc.SetBrush(drawing_properties["brush_foreground"])
-
-        # save the rectangle data to check if the user clicks on it
-        self._HorizontalScrollbarRectangle = wx.Rect(int(topOfBarY), 0, 
-                                                     int(barHeight), self._ScrollbarWidth)
+        gcdc.SetPen(drawing_properties.pen)
+        gc.SetBrush(self._getFillBrush(drawing_properties, "foreground", self._HorizontalScrollbar))
 
         if (self._config.scrollbar_type == "rectangular"):
             gc.DrawRectangle(self._HorizontalScrollbarRectangle.GetX(),
@@ -6,6 +6,8 @@
 
 import wx
 from .utils.dip import dip
+from .utils.fontCache import getFont
+from .utils.textMetrics import getTextExtents
 from .base._CustomObject import CustomObject
 from .CustomPanel import CustomPanel
 
@@ -31,12 +33,10 @@ class CustomStaticBox(wx.Panel, CustomObject):
         # ------------------- content panel ------------------- #
 
         # get the text height to correctly offset the content panel
-        # from the top.
-        dc = wx.ScreenDC()
-        dc.SetFont(wx.Font(self._config.text_font_size_default,
-                           wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL,
-                           faceName=self._config.text_font_facename_default))
-        _, self.textHeight = dc.GetTextExtent(self._Label)
+        # from the top. the label is measured again only when the
+        # label or its font change.
+        self._LabelExtent = self._measureLabel()
+        self.textHeight = self._LabelExtent[1]
 
         # create content panel
         #self.__Panel = wx.Panel(parent=self)
@@ -46,7 +46,7 @@ class CustomStaticBox(wx.Panel, CustomObject):
 
         # create a sizer to ourselves and then add the panel with the correct paddings
         self.__Sizer = wx.BoxSizer(wx.VERTICAL)
-        self.__Sizer.AddSpacer(self.textHeight)
+        self.__Spacer = self.__Sizer.AddSpacer(self.textHeight)
         self.__Sizer.Add(self.__Panel, 
                          proportion=1,
                          flag=wx.EXPAND|wx.LEFT|wx.RIGHT|wx.BOTTOM,
@@ -64,19 +64,66 @@ class CustomStaticBox(wx.Panel, CustomObject):
         self._config.background_colour_default = (colour.GetRed(),
                                                   colour.GetGreen(),
                                                   colour.GetBlue())
-        self.Refresh()
+        self._requestRefresh()
 
 
     def SetBorderColour(self, colour:wx.Colour):
         self._config.border_colour_default = (colour.GetRed(),
                                               colour.GetGreen(),
                                               colour.GetBlue())
-        self.Refresh()
+        self._requestRefresh()
 
 
     def SetBorderWidth(self, width:int):
         self._config.border_width_default = width
-        self.Refresh()
+        self._requestRefresh()
+
+
+    def SetLabel(self, label:str):
+        self._Label = label
+        self._updateLabelGeometry()
+        self._requestRefresh()
+
+
+    def GetLabel(self):
+        return self._Label
+
+
+    def _measureLabel(self) -> tuple:
+        return getTextExtents([self._Label],
+                              self._config.text_font_size_default,
+                              self._config.text_font_facename_default)[0]
+
+
+    def _updateLabelGeometry(self):
+        """Measures the label again, and makes room for it above the
+        content panel if its height changed."""
+        self._LabelExtent = self._measureLabel()
+        if self._LabelExtent[1] != self.textHeight:
+            self.textHeight = self._LabelExtent[1]
+            self.__Spacer.AssignSpacer(0, self.textHeight)
+            self.InvalidateBestSize()
+            self._requestLayout()
+            if self.GetParent():
+                self._requestLayout(self.GetParent())
+
+
+    def _applyConfigChanges(self, fields:set):
+        if any(name.startswith("text_font_") for name in fields):
+            self._updateLabelGeometry()
+        super()._applyConfigChanges(fields)
+
+
+    def _rebuildStructure(self, fields:set):
+        """Applies a change of padding to the content panel."""
+        if "padding_all_sides" in fields:
+            self.__Sizer.GetItem(self.__Panel).SetBorder(self._config.padding_all_sides)
+            self._requestLayout()
+
+
+    def _clearScaleCaches(self):
+        super()._clearScaleCaches()
+        self._updateLabelGeometry()
 
 
     def GetBackgroundColour(self):
@@ -95,7 +142,7 @@ class CustomStaticBox(wx.Panel, CustomObject):
 
         # drawing area background
         gcdc.SetPen(wx.TRANSPARENT_PEN)
-        gcdc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gcdc.SetBrush(self._getParentBackgroundBrush())
         gcdc.DrawRectangle(controlRect)
         
         # ------------------- pen and brush ------------------- #
@@ -104,46 +151,43 @@ class CustomStaticBox(wx.Panel, CustomObject):
         # behavior. it has only a "default" state.
         drawing_properties = self._getStateDrawingProperties("default", gc)
 
-        pen = drawing_properties["pen"]
-        gcdc.SetPen(pen)        
-        gc.SetBrush(drawing_properties["brush_background"])
+        pen = drawing_properties.pen
 
         # ---------------- staticbox rectangle ---------------- #
 
         paddingSides = self._config.border_width_default
         paddingTop = self.textHeight // 2
 
-        gc.DrawRoundedRectangle(controlRect.GetX() + paddingSides,
-                                controlRect.GetY() + paddingTop,
-                                controlRect.GetWidth() - (2 * paddingSides),
-                                controlRect.GetHeight() - paddingTop - paddingSides,
-                                self._config.corner_radius_default)
+        boxRect = wx.Rect(controlRect.GetX() + paddingSides,
+                          controlRect.GetY() + paddingTop,
+                          controlRect.GetWidth() - (2 * paddingSides),
+                          controlRect.GetHeight() - paddingTop - paddingSides)
+        if not self._drawNineSlice(gc, drawing_properties, boxRect, self._config.corner_radius_default):
+            gcdc.SetPen(pen)
+            gc.SetBrush(self._getFillBrush(drawing_properties, "background"))
+            gc.DrawRoundedRectangle(*boxRect.Get(), self._config.corner_radius_default)
 
         # -------------------- draw label -------------------- #
         
         gc.SetPen(wx.TRANSPARENT_PEN)
-        gc.SetBrush(wx.Brush(self.GetParent().GetBackgroundColour()))
+        gc.SetBrush(self._getParentBackgroundBrush())
         gc.SetBrush(wx.RED_BRUSH)
-        gc.SetFont(wx.Font(self._config.text_font_size_default,
-                           wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL,
-                           faceName=self._config.text_font_facename_default),
+        gc.SetFont(getFont(self._config.text_font_size_default, self._config.text_font_facename_default),
                    wx.Colour(*self._config.text_foreground_colour_default))
-        textWidth, textHeight, _, _ = gc.GetFullTextExtent(self._Label)
+        textWidth, textHeight = self._LabelExtent
         # centered values
         textX = (controlRect.GetWidth() // 2) - (textWidth // 2)
         textY = (paddingTop - textHeight//2)
         # draw text background
-        lateralOffset = dip(5)
+        lateralOffset = dip(5, window=self)
         gc.DrawRectangle(textX-lateralOffset, textY, textWidth+(2*lateralOffset), textHeight)
         # draw text
         gc.DrawText(self._Label, textX, textY)
 
-        # -------------- make panel update size -------------- #
-
-        self.Layout()
-
 
     def __OnSize(self, event):
-        self.Refresh()
+        # the label is centered, so the whole box is repainted. the
+        # content panel is laid out by the sizer.
+        self._requestRefresh()
         event.Skip()
         
@@ -0,0 +1,173 @@
+# CustomStyleSheet.py
+# wxCustomControls
+# CSS-like cascading configuration rules. The config of an object is
+# resolved from its class defaults, then the rules scoped to its
+# containers, then the rules of its named style classes, and finally
+# its own overrides. Resolved configs are cached per selector chain,
+# so objects with identical ancestry share a single config.
+# 18/oct/2026
+
+
+from .utils.dip import getWindowScaleFactor
+from .CustomConfig import CustomConfig, FIELD_NAMES
+from .functions.getDefaultConfig import getSharedDefaultConfig, addRegistrationListener
+
+
+# rule layers, applied in this order
+_LAYER_CLASS = 0     # "CustomButton"
+_LAYER_CONTAINER = 1 # "CustomStaticBox CustomButton"
+_LAYER_NAMED = 2     # ".danger", "CustomStaticBox CustomButton.danger"
+
+
+def _parseSelector(selector:str) -> tuple:
+    """Returns the selector as a tuple of (type name, classes)
+    compounds. "*" and ".name" compounds have no type name."""
+    compounds = []
+    for compound in selector.split():
+        typeName, *classes = compound.split(".")
+        if typeName in ("", "*"):
+            typeName = None
+        if (not typeName and not classes and compound != "*") or ("" in classes):
+            raise ValueError(f"CustomStyleSheet::Invalid selector \"{selector}\".")
+        compounds.append((typeName, frozenset(classes)))
+    if not compounds:
+        raise ValueError("CustomStyleSheet::Empty selector.")
+    return tuple(compounds)
+
+
+def parseStyleClasses(style_classes) -> frozenset:
+    """Accepts a space separated string or an iterable of names."""
+    if not style_classes:
+        return frozenset()
+    if isinstance(style_classes, str):
+        return frozenset(style_classes.split())
+    return frozenset(style_classes)
+
+
+def _matches(compound:tuple, element:tuple) -> bool:
+    typeName, classes = compound
+    elementType, elementClasses = element
+    if typeName and typeName not in (cls.__name__ for cls in elementType.__mro__):
+        return False
+    return classes <= elementClasses
+
+
+class CustomStyleSheet:
+    def __init__(self):
+
+        self._Rules = [] # (layer, compounds, values) in insertion order
+
+        # (scale, target, ancestors) -> resolved CustomConfig
+        self._Resolved = {}
+
+
+    def AddRule(self, selector:str, **kwargs):
+        """Adds a rule. Selectors are a space separated chain of
+        compounds (descendant combinator), each one a class name
+        and/or style classes: "CustomStaticBox CustomButton.danger"."""
+        compounds = _parseSelector(selector)
+        if not (kwargs.keys() <= FIELD_NAMES):
+            CustomConfig._checkKeys(kwargs)
+            kwargs = {key: value for key, value in kwargs.items() if key in FIELD_NAMES}
+        if compounds[-1][1]:
+            layer = _LAYER_NAMED
+        elif len(compounds) > 1:
+            layer = _LAYER_CONTAINER
+        else:
+            layer = _LAYER_CLASS
+        self._Rules.append((layer, compounds, kwargs))
+        self._updateResolved()
+
+
+    def RemoveRules(self, selector:str):
+        """Removes all the rules with the selector."""
+        compounds = _parseSelector(selector)
+        self._Rules = [rule for rule in self._Rules if rule[1] != compounds]
+        self._updateResolved()
+
+
+    def Clear(self):
+        self._Rules.clear()
+        self._updateResolved()
+
+
+    def HasRules(self) -> bool:
+        return bool(self._Rules)
+
+
+    def Resolve(self, customObject, style_classes=frozenset()) -> CustomConfig:
+        """Returns the config for the object, shared by every object
+        with the same class, style classes and ancestors. It is
+        resolved even without rules, so it follows the rules added
+        later, and for the DPI scale of the window of the object."""
+        ancestors = []
+        window = customObject.GetParent()
+        while window:
+            ancestors.append((type(window), getattr(window, "_StyleClasses", frozenset())))
+            window = window.GetParent()
+
+        return self._getResolved((getWindowScaleFactor(customObject), (type(customObject), style_classes), tuple(ancestors)))
+
+
+    def GetRescaledConfig(self, config:CustomConfig, scale:float) -> CustomConfig:
+        """If the config was resolved by the style sheet, returns the
+        config of the same selector chain for the DPI scale. Returns
+        None for any other config."""
+        for key, resolved in list(self._Resolved.items()):
+            if resolved is config:
+                return self._getResolved((scale,) + key[1:])
+        return None
+
+
+    def _getResolved(self, key:tuple) -> CustomConfig:
+        config = self._Resolved.get(key)
+        if config is None:
+            config = self._Resolved[key] = CustomConfig(**self._getValues(key))
+        return config
+
+
+    def _getValues(self, key:tuple) -> dict:
+        """Cascades the matching rules over the class defaults."""
+        scale, target, ancestors = key
+        values = getSharedDefaultConfig(target[0], scale).ToDict()
+        for layer in (_LAYER_CLASS, _LAYER_CONTAINER, _LAYER_NAMED):
+            for ruleLayer, compounds, ruleValues in self._Rules:
+                if (ruleLayer == layer) and self.__matchesChain(compounds, target, ancestors):
+                    values.update(ruleValues)
+        return values
+
+
+    @staticmethod
+    def __matchesChain(compounds:tuple, target:tuple, ancestors:tuple) -> bool:
+        if not _matches(compounds[-1], target):
+            return False
+        # remaining compounds must match ancestors, from the nearest
+        # one outwards
+        remaining = list(compounds[:-1])
+        for ancestor in ancestors:
+            if not remaining:
+                break
+            if _matches(remaining[-1], ancestor):
+                remaining.pop()
+        return not remaining
+
+
+    def _updateResolved(self):
+        """Updates the cached configs in place after the rules or the
+        registered defaults changed. Their subscribers are refreshed
+        through the repaint queue, so a change costs one update per
+        unique selector chain instead of a walk over all the
+        objects."""
+        for key, config in self._Resolved.items():
+            for name, value in self._getValues(key).items():
+                if getattr(config, name) != value:
+                    setattr(config, name, value)
+
+
+_StyleSheet = CustomStyleSheet()
+addRegistrationListener(_StyleSheet._updateResolved)
+
+
+def getStyleSheet() -> CustomStyleSheet:
+    """Returns the style sheet used by all custom objects."""
+    return _StyleSheet
@@ -1,9 +1,23 @@
 __all__ = []
 
-from .utils.dip import dip
-from .utils.dpiAwareness import setDpiAwareness
+from .utils.dip import dip, dipBatch, getScaleFactor, getWindowScaleFactor
+from .utils.fontCache import getFont, clearFontCache, getFontCacheStats
+from .utils.textMetrics import getTextExtents, setTextExtentCacheSize, getTextExtentCacheStats
+from .utils.imageCache import setImageCacheBudget, clearImageCache, getImageCacheStats
+from .utils.gdiPool import getGdiPoolStats
+from .utils.gradientCache import setGradientCacheBudget, clearGradientCache, getGradientCacheStats
+from .utils.retainedBitmaps import setRetainedBitmapBudget, getRetainedBitmapStats
+from .utils.nineSlice import clearNineSliceCache, getNineSliceCacheStats
+from .utils.backBuffers import getBackBufferStats
+from .utils.cacheRegistry import stats, setMemoryBudget, getMemoryBudget
+from .utils.assetCache import setAssetCacheDirectory, clearAssetCache, getAssetCacheStats
+from .utils.repaintQueue import setTargetFrameRate, setImmediateMode, flushRepaints, getFrameSchedulerStats
+from .utils.dpiAwareness import setDpiAwareness, propagateDpiChange
 
-from .CustomConfig import CustomConfig
+from .CustomConfig import CustomConfig, CustomConfigOverlay
+from .functions.getDefaultConfig import getDefaultConfig, registerDefaultConfig
+from .functions.loadTheme import loadTheme
+from .CustomStyleSheet import CustomStyleSheet, getStyleSheet
 
 from .CustomPanel import CustomPanel
 from .CustomStaticBox import CustomStaticBox
@@ -17,14 +17,15 @@ class CustomControl(wx.Control, CustomObject):
                  validator=wx.DefaultValidator,
                  name=wx.ControlNameStr, config=None, **kwargs):
 
-        super().__init__(parent, id, pos, size, wx.NO_BORDER|style, validator, name)
-        CustomObject.__init__(self, config, **kwargs)
-
         # ---------------- control attributes ---------------- #
 
-        self._Label = kwargs.get("label", None) # not always present
-        self._Value = kwargs.get("value", None) # not always present
-        self._Choices = kwargs.get("choices", None) # not always present
+        # taken out of kwargs so they do not end up as config overrides
+        self._Label = kwargs.pop("label", None) # not always present
+        self._Value = kwargs.pop("value", None) # not always present
+        self._Choices = kwargs.pop("choices", None) # not always present
+
+        super().__init__(parent, id, pos, size, wx.NO_BORDER|style, validator, name)
+        CustomObject.__init__(self, config, **kwargs)
             
         # -------------- control state booleans -------------- #
 
@@ -51,7 +52,7 @@ class CustomControl(wx.Control, CustomObject):
 
     def SetLabel(self, label:str):
         self._Label = label
-        self.Refresh()
+        self._requestRefresh()
 
 
     def GetLabel(self):
@@ -100,14 +101,16 @@ class CustomControl(wx.Control, CustomObject):
 
 
     def __OnMouseEnter(self, event):
+        oldState = self.GetStateAsString()
         self._Hover = True
-        self.Refresh()
+        self._onStateChanged(oldState)
         event.Skip()
 
 
     def __OnMouseLeave(self, event):
+        oldState = self.GetStateAsString()
         self._Hover = False
-        self.Refresh()
+        self._onStateChanged(oldState)
         event.Skip()
 
 
@@ -124,9 +127,10 @@ class CustomControl(wx.Control, CustomObject):
         instead of using default behavior (problems redrawing after
         modal dialogs).
         """
+        oldState = self.GetStateAsString()
         self._Enabled = enable
         super().Enable(enable)
-        self.Refresh()
+        self._onStateChanged(oldState)
 
 
     def Disable(self) -> None:
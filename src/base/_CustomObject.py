@@ -6,10 +6,20 @@
 
 
 import wx
-from copy import copy
-from ..utils.dip import dip
-from ..CustomConfig import CustomConfig
-from ..functions.getDefaultConfig import getDefaultConfig
+from ..utils.dip import dip, getWindowScaleFactor
+from ..utils.textMetrics import getTextExtent, getTextExtents
+from ..utils.imageCache import getImageBitmap
+from ..utils.gdiPool import acquireBrush, releaseResource
+from ..utils.gradientCache import getGradientBrush
+from ..utils.retainedBitmaps import RetainedBitmapCache
+from ..utils.nineSlice import getNineSlice
+from ..utils.backBuffers import getBackBuffer
+from ..utils.repaintQueue import requestRefresh, requestLayout
+from ..utils.dpiAwareness import watchDpiChanges
+from ..CustomConfig import CustomConfig, CustomConfigOverlay, FIELDS, DIP_FIELDS, getChangeEffect, scaleDipValue
+from ._CustomStyle import CustomStyle, compileStyles
+from ..functions.getDefaultConfig import getRescaledDefaultConfig
+from ..CustomStyleSheet import getStyleSheet, parseStyleClasses
 
 
 class CustomObject:
@@ -17,159 +27,288 @@ class CustomObject:
 
         # --------- get the config for current object --------- #
 
+        # named style classes used by the style sheet rules
+        self._StyleClasses = parseStyleClasses(kwargs.pop("style_classes", None))
+
+        # the object does not copy the config. it reads from it through
+        # an overlay that keeps its own changes, so the passed config
+        # is never mutated and can be shared by many objects. without a
+        # config, the base is resolved by the style sheet.
         if config:
-            self._config:CustomConfig = copy(config)
+            base = config
         else:
-            self._config:CustomConfig = getDefaultConfig(self.__class__.__name__)
-        
-        self._config.Update(**kwargs)
+            base = getStyleSheet().Resolve(self, self._StyleClasses)
+
+        self._config:CustomConfigOverlay = CustomConfigOverlay(base, **kwargs)
+
+        # get notified when the shared config changes
+        self._config.GetBase().Subscribe(self)
+
+        # the top level window updates its custom objects on dpi changes
+        watchDpiChanges(self)
+
+        # pooled pens and brushes used while painting, by name
+        self._HeldResources = {}
+
+        # rendered visual states, used if render_retained_bitmap is set
+        self._RetainedBitmaps = RetainedBitmapCache()
+        self._RetainedContents = None
+        self._PendingRetainedKey = None
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.__OnDestroy)
+
+
+    def __OnDestroy(self, event:wx.WindowDestroyEvent):
+        # the event also reaches the parents of the destroyed window
+        if event.GetEventObject() is self:
+            for _, resource in self._HeldResources.values():
+                releaseResource(resource)
+            self._HeldResources.clear()
+            self._RetainedBitmaps.Clear()
+        event.Skip()
 
 
     def SetConfig(self, config:CustomConfig):
-        self._config = config
-        self.Refresh()
+        oldConfig = self._config
+        oldConfig.GetBase().Unsubscribe(self)
+        self._config = CustomConfigOverlay(config)
+        self._config.GetBase().Subscribe(self)
+        self._applyConfigChanges({name for name in FIELDS
+                                  if getattr(oldConfig, name) != getattr(self._config, name)})
 
         
     def GetConfig(self):
         return self._config
 
 
+    def GetStyleClasses(self) -> frozenset:
+        return self._StyleClasses
+
+
     def UpdateConfig(self, **kwargs):
-        self._config.Update(**kwargs)
-        self.Refresh()
+        config = self._config
+        changed = {key for key, value in kwargs.items()
+                   if (key in FIELDS) and (getattr(config, key) != value)}
+        config.Update(**kwargs)
+        self._applyConfigChanges(changed)
+
+
+    def _onSharedConfigChanged(self, fields:set):
+        """Called once per repaint pass after fields of the shared base
+        config changed. Fields overridden by this object are not
+        visible, so they are ignored."""
+        self._applyConfigChanges(fields - self._config._Overrides.keys())
+
+
+    def _applyConfigChanges(self, fields:set):
+        """Performs the least amount of work needed after the fields
+        changed, depending on the effect declared in the config
+        schema."""
+        effect = getChangeEffect(fields)
+        if effect is None:
+            return
+        self._RetainedBitmaps.Clear()
+        if any(name.startswith("cursor_") for name in fields):
+            self._applyStateCursor()
+        if (effect == "structural"):
+            self._rebuildStructure(fields)
+        if (effect != "paint"):
+            self.InvalidateBestSize()
+            parent = self.GetParent()
+            if parent:
+                self._requestLayout(parent)
+        self._requestRefresh()
+
+
+    def _rebuildStructure(self, fields:set):
+        """Rebuilds the parts of the object created from the changed
+        structural fields. Overridden by objects that have them."""
+        pass
+
+
+    def _rescaleForDpi(self, ratio:float):
+        """Rescales the dip fields of the config after a DPI change.
+        Shared default configs and configs resolved by the style sheet
+        are replaced by the ones of the new scale. Other base configs
+        belong to the application (and may be used by windows on other
+        displays), so they are not modified: their dip values are
+        rescaled into the overlay. Layout and refresh are left to the
+        caller."""
+        base = self._config.GetBase()
+        overrides = self._config.GetOverrides()
+        scale = getWindowScaleFactor(self)
+        newBase = getRescaledDefaultConfig(base, scale) or getStyleSheet().GetRescaledConfig(base, scale)
+        if newBase is None:
+            newBase = base
+            overrides = {**{name: getattr(base, name) for name in DIP_FIELDS}, **overrides}
+        overrides = {name: scaleDipValue(value, ratio) if (name in DIP_FIELDS) else value
+                     for name, value in overrides.items()}
+        base.Unsubscribe(self)
+        self._config = CustomConfigOverlay(newBase, **overrides)
+        newBase.Subscribe(self)
+        self._rebuildStructure({name for name in DIP_FIELDS if (FIELDS[name].effect == "structural")})
+        self._clearScaleCaches()
+
+
+    def _clearScaleCaches(self):
+        """Drops the values that depend on the DPI scale."""
+        self.InvalidateBestSize()
+        self._RetainedBitmaps.Clear()
 
 
     def GetBackgroundColour(self):
         return wx.Colour(*self._config.background_colour_default)
         
 
-    def _getDrawingContexts(self, window=None):
+    def _paintRetainedBitmap(self) -> bool:
+        """In retained bitmap mode, paints the bitmap of the current
+        visual state and returns True. Returns False if the state has
+        to be drawn; the drawing is then kept for the next paints (see
+        _getDrawingContexts)."""
+        if not self._config.render_retained_bitmap:
+            return False
+
+        # the states are only valid for the same contents. the compiled
+        # styles are replaced after any change to the config.
+        width, height = self.GetClientSize()
+        contents = (self._Label, width, height, self.GetParent().GetBackgroundColour().GetRGBA(),
+                    self._getCompiledStyles())
+        if contents != self._RetainedContents:
+            self._RetainedBitmaps.Clear()
+            self._RetainedContents = contents
+
+        state = self.GetStateAsString()
+        key = (state, self._Value)
+        bitmap = self._RetainedBitmaps.Get(key)
+        if bitmap is None:
+            self._PendingRetainedKey = key if (width > 0 and height > 0) else None
+            return False
+        wx.PaintDC(self).DrawBitmap(bitmap, 0, 0)
+        return True
+
+
+    def _getDrawingContexts(self, window=None, clip:wx.Rect=None):
+        """Returns the contexts to paint the window (the object if None).
+        If clip is given, only that rectangle of the window is cleared
+        and drawn."""
         window = window if window else self
-        dc = wx.BufferedPaintDC(window)
+        if (window is self) and (self._PendingRetainedKey is not None):
+            # draw into a bitmap that is kept as the state's retained
+            # bitmap, and copied to the window when painting ends
+            width, height = self.GetClientSize()
+            buffer = wx.Bitmap(width, height)
+            self._RetainedBitmaps.Put(self._PendingRetainedKey, buffer, width * height * 4)
+            self._PendingRetainedKey = None
+            dc = wx.BufferedPaintDC(window, buffer)
+        else:
+            dc = wx.BufferedPaintDC(window, getBackBuffer(window))
         gcdc = wx.GCDC(dc)
         gc:wx.GraphicsContext = gcdc.GetGraphicsContext()
+        # the shared buffer can be bigger than the window, so only the
+        # window area is cleared and drawn
+        area = wx.Rect(wx.Point(0, 0), window.GetClientSize())
+        if clip is not None:
+            area = area.Intersect(clip)
+        gcdc.SetClippingRegion(area)
         gcdc.Clear()
         return gcdc, gc
 
     
-    def _getPen(self, state:str) -> wx.Pen:
-        """Returns a transparent pen if the border width is 0."""
-        borderWidth, borderColour = 0, wx.BLACK
-        if (state == "disabled"):
-            borderWidth = self._config.border_width_disabled
-            borderColour = self._config.border_colour_disabled
-        elif (state == "pressed"):
-            borderWidth = self._config.border_width_pressed
-            borderColour = self._config.border_colour_pressed
-        elif (state == "hover"):
-            borderWidth = self._config.border_width_hover
-            borderColour = self._config.border_colour_hover
-        elif (state == "default"):
-            borderWidth = self._config.border_width_default
-            borderColour = self._config.border_colour_default
-        # -------------------- return pen -------------------- #
-        if borderWidth:
-            return wx.Pen(borderColour, borderWidth)
-        else:
-            return wx.TRANSPARENT_PEN
-        
-
-    def _getBrush(self, state:str, layer:str, gc:wx.GraphicsContext) -> wx.Brush:
-        gradient, colour = None, (255, 255, 255)
-        if (state == "default"):
-            gradient = self._config.background_linear_gradient_default if (layer == "background") else self._config.foreground_linear_gradient_default
-            colour = self._config.background_colour_default if (layer == "background") else self._config.foreground_colour_default
-        elif (state == "pressed"):
-            gradient = self._config.background_linear_gradient_pressed if (layer == "background") else self._config.foreground_linear_gradient_pressed
-            colour = self._config.background_colour_pressed if (layer == "background") else self._config.foreground_colour_pressed
-        elif (state == "hover"):
-            gradient = self._config.background_linear_gradient_hover if (layer == "background") else self._config.foreground_linear_gradient_hover
-            colour = self._config.background_colour_hover if (layer == "background") else self._config.foreground_colour_hover
-        elif (state == "disabled"):
-            gradient = self._config.background_linear_gradient_disabled if (layer == "background") else self._config.foreground_linear_gradient_disabled
-            colour = self._config.background_colour_disabled if (layer == "background") else self._config.foreground_colour_disabled
-
-        if gradient:
-            c1 = wx.Colour(*gradient[4])
-            c2 = wx.Colour(*gradient[5])
-            x1, y1, x2, y2, _, _ = gradient
-            brush = gc.CreateLinearGradientBrush(x1, y1, x2, y2, c1, c2)
-        else:
-            brush = wx.Brush(colour)
-
-        return brush
-
-
-    def _getStateDrawingProperties(self, control_state:str, gc:wx.GraphicsContext):
-
-        if control_state not in ["default", "pressed", "hover", "disabled"]:
+    def _holdResource(self, name:str, acquire, *args):
+        """Returns the pooled resource acquire(*args) (see gdiPool). The
+        object holds it under name until it needs a different one or
+        is destroyed."""
+        held = self._HeldResources.get(name)
+        if (held is not None) and (held[0] == args):
+            return held[1]
+        resource = acquire(*args)
+        if held is not None:
+            releaseResource(held[1])
+        self._HeldResources[name] = (args, resource)
+        return resource
+
+
+    def _requestRefresh(self, window:wx.Window=None, rect:wx.Rect=None):
+        """Marks the window (the object if None), or the rectangle of
+        it, to be repainted in the next frame."""
+        requestRefresh(window or self, rect)
+
+
+    def _requestLayout(self, window:wx.Window=None):
+        """Lays out the window (the object if None) in the next frame."""
+        requestLayout(window or self)
+
+
+    def _getParentBackgroundBrush(self) -> wx.Brush:
+        return self._holdResource("parent_background", acquireBrush, self.GetParent().GetBackgroundColour())
+
+
+    def _getFillBrush(self, drawing_properties:CustomStyle, which:str, window:wx.Window=None) -> wx.Brush:
+        """Returns the "background" or "foreground" brush of the drawing
+        properties. Gradients are rasterized for the client size of the
+        window (the object if None)."""
+        gradient = getattr(drawing_properties, f"{which}_gradient")
+        if gradient is None:
+            return getattr(drawing_properties, f"brush_{which}")
+        return getGradientBrush(gradient, (window or self).GetClientSize())
+
+
+    def _drawNineSlice(self, gc:wx.GraphicsContext, drawing_properties:CustomStyle, rectangle:wx.Rect, radius) -> bool:
+        """In nine slice mode, draws the rounded rectangle of the drawing
+        properties from the shared skin and returns True. Returns False
+        if the rectangle has to be drawn with vectors (gradient fills or
+        rectangles smaller than the corners)."""
+        if not self._config.render_nine_slice or (drawing_properties.background_gradient is not None):
+            return False
+        skin = getNineSlice(drawing_properties.pen, drawing_properties.brush_background, radius)
+        x, y, width, height = rectangle.Get()
+        if not skin.CanDraw(width, height):
+            return False
+        skin.Draw(gc, x, y, width, height)
+        return True
+
+
+    def _onStateChanged(self, oldState:str, window:wx.Window=None, rect:wx.Rect=None):
+        """Called after the control state may have changed. Applies the
+        cursor of the new state, and refreshes the window (the object if
+        None), or only the rectangle of it if given, if the new state
+        looks different from the old one. rect can also be a function
+        returning it, so it is only calculated when needed."""
+        newState = self.GetStateAsString()
+        if (newState == oldState):
+            return
+        old = self._getStateDrawingProperties(oldState)
+        new = self._getStateDrawingProperties(newState)
+        window = window or self
+        if new.cursor is not old.cursor:
+            window.SetCursor(new.cursor)
+        if new.visual_key != old.visual_key:
+            self._requestRefresh(window, rect() if callable(rect) else rect)
+
+
+    def _applyStateCursor(self):
+        """Applies the cursor of the current state (objects without
+        states keep the default cursor)."""
+        if hasattr(self, "GetStateAsString"):
+            self.SetCursor(self._getStateDrawingProperties(self.GetStateAsString()).cursor)
+
+
+    def _getCompiledStyles(self) -> dict:
+        """Returns the {state: CustomStyle} styles of the config."""
+        styles = self._config._compiledStyles
+        if styles is None:
+            styles = compileStyles(self._config)
+            self._config._compiledStyles = styles
+        return styles
+
+
+    def _getStateDrawingProperties(self, control_state:str, gc:wx.GraphicsContext=None) -> CustomStyle:
+        """Returns the compiled style of the state. The styles are
+        compiled once per config and reused until the config changes."""
+        try:
+            return self._getCompiledStyles()[control_state]
+        except KeyError:
             raise ValueError("getStateProperties::Invalid control_state.")
 
-        pen = self._getPen(control_state) # takes care of borders
-        brush_background = self._getBrush(control_state, "background", gc) # takes care of background
-        brush_foreground = self._getBrush(control_state, "foreground", gc)
-
-        if (control_state == "default"):
-            cursor = wx.Cursor(wx.CURSOR_ARROW)
-            text_font_size = self._config.text_font_size_default
-            text_font_facename = self._config.text_font_facename_default
-            text_foreground_colour = self._config.text_foreground_colour_default
-            corner_radius = self._config.corner_radius_default
-            image = self._config.image_default
-            image_channels = self._config.image_channels_default
-            image_size = self._config.image_size_default
-            background_colour_active = self._config.background_colour_active_default
-            foreground_colour_active = self._config.foreground_colour_active_default
-        elif (control_state == "pressed"):
-            cursor = wx.Cursor(self._config.cursor_stockcursor_pressed)
-            text_font_size = self._config.text_font_size_pressed
-            text_font_facename = self._config.text_font_facename_pressed
-            text_foreground_colour = self._config.text_foreground_colour_pressed
-            corner_radius = self._config.corner_radius_pressed
-            image = self._config.image_pressed
-            image_channels = self._config.image_channels_pressed
-            image_size = self._config.image_size_pressed
-            background_colour_active = self._config.background_colour_active_pressed
-            foreground_colour_active = self._config.foreground_colour_active_pressed
-        elif (control_state == "hover"):
-            cursor = wx.Cursor(self._config.cursor_stockcursor_hover)
-            text_font_size = self._config.text_font_size_hover
-            text_font_facename = self._config.text_font_facename_hover
-            text_foreground_colour = self._config.text_foreground_colour_hover
-            corner_radius = self._config.corner_radius_hover
-            image = self._config.image_hover
-            image_channels = self._config.image_channels_hover
-            image_size = self._config.image_size_hover
-            background_colour_active = self._config.background_colour_active_hover
-            foreground_colour_active = self._config.foreground_colour_active_hover
-        else: # disabled
-            cursor = wx.Cursor(self._config.cursor_stockcursor_disabled)
-            text_font_size = self._config.text_font_size_disabled
-            text_font_facename = self._config.text_font_facename_disabled
-            text_foreground_colour = self._config.text_foreground_colour_disabled
-            corner_radius = self._config.corner_radius_disabled
-            image = self._config.image_disabled
-            image_channels = self._config.image_channels_disabled
-            image_size = self._config.image_size_disabled
-            background_colour_active = self._config.background_colour_active_disabled
-            foreground_colour_active = self._config.foreground_colour_active_disabled
-
-        return {
-            "pen": pen,
-            "brush_background": brush_background,
-            "brush_foreground": brush_foreground,
-            "cursor": cursor,
-            "text_font_size": text_font_size,
-            "text_font_facename": text_font_facename,
-            "text_foreground_colour": text_foreground_colour,
-            "corner_radius": corner_radius,
-            "image": image,
-            "image_channels": image_channels,
-            "image_size": image_size,
-            "background_colour_active": background_colour_active,
-            "foreground_colour_active": foreground_colour_active
-        }
-
 
     def _getObjectSideDimensions(self,
                                  object1Width:int, object1Height:int,
@@ -210,7 +349,7 @@ class CustomObject:
             object2Y = r.GetY() + (r.GetHeight() // 2) - (object2Height // 2)
 
         else:
-            separation = separation if separation else dip(6)
+            separation = separation if separation else dip(6, window=self)
             
             if (object2_side == "right"):
                 object1X = r.GetX() + (r.GetWidth() // 2) - ((object1Width + separation + object2Width) // 2)
@@ -252,19 +391,15 @@ class CustomObject:
             
         if theresText:
             gcdc.DrawText(text, textX, textY)
-        if theresImage:
+        if theresImage and bitmap:
             gcdc.DrawBitmap(bitmap, imageX, imageY)
 
 
-    def _getTextDimensions(self, gcdc, string, drawing_properties):        
+    def _getTextDimensions(self, gcdc, string, drawing_properties:CustomStyle):
         textWidth, textHeight = 0, 0
         if (string != wx.EmptyString):
-            gcdc.GetGraphicsContext().SetFont(wx.Font(drawing_properties["text_font_size"],
-                               wx.FONTFAMILY_DEFAULT,
-                               wx.FONTSTYLE_NORMAL,
-                               wx.FONTWEIGHT_NORMAL,
-                               faceName=drawing_properties["text_font_facename"]), drawing_properties["text_foreground_colour"])
-            textWidth, textHeight = gcdc.GetTextExtent(string)
+            gcdc.GetGraphicsContext().SetFont(drawing_properties.font, drawing_properties.text_foreground_colour)
+            textWidth, textHeight = getTextExtent(gcdc, drawing_properties.font_key, string)
         return textWidth, textHeight
     
 
@@ -273,13 +408,12 @@ class CustomObject:
             imageWidth, imageHeight = self._getMaxDimensions("image")
         else:
             imageWidth, imageHeight = 0, 0
-        bitmap = wx.Bitmap(1, 1)
-        if drawing_properties["image"]:
-            imageWidth, imageHeight = drawing_properties["image_size"]
-            image:wx.Image = drawing_properties["image"].AdjustChannels(*drawing_properties["image_channels"])
-            bitmap:wx.Bitmap = image.ConvertToBitmap()
-            imageWidth, imageHeight = drawing_properties["image_size"]
-            bitmap.SetSize(wx.Size(imageWidth, imageHeight))
+        bitmap = None
+        if drawing_properties.image:
+            imageWidth, imageHeight = drawing_properties.image_size
+            bitmap = getImageBitmap(drawing_properties.image,
+                                    drawing_properties.image_channels,
+                                    drawing_properties.image_size)
         return imageWidth, imageHeight, bitmap
 
 
@@ -306,14 +440,12 @@ class CustomObject:
             raise ValueError("_getMaxDimensions::Wrong \"what\" value.")
 
 
-    def _getDefaultTextExtent(self, gcdc:wx.GCDC, text):
-        """Get the text extent using the default font and facename."""
-        gcdc.SetFont(wx.Font(self._config.text_font_size_default,
-                             wx.FONTFAMILY_DEFAULT,
-                             wx.FONTSTYLE_NORMAL,
-                             wx.FONTWEIGHT_NORMAL,
-                             faceName=self._config.text_font_facename_default))
-        return gcdc.GetTextExtent(text)
+    def _getDefaultTextExtent(self, text):
+        """Get the text extent using the default font and facename. Only
+        strings missing from the cache are measured, on the shared
+        measuring dc."""
+        return getTextExtents([text], self._config.text_font_size_default,
+                              self._config.text_font_facename_default)[0]
 
 
     def unused_getIfImage(self):
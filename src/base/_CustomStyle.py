@@ -0,0 +1,110 @@
+# _CustomStyle.py
+# wxCustomControls
+# Compiled drawing properties. A CustomConfig is resolved once into an
+# immutable record per control state, so the paint handlers do not
+# rebuild pens, brushes, fonts and cursors on every paint.
+# 18/oct/2026
+
+
+import wx
+from ..CustomConfig import STATES, FIELD_NAMES
+from ..utils.fontCache import getFont, getFontKey
+from ..utils.gradientCache import parseGradient
+from ..utils.gdiPool import acquirePen, acquireBrush, acquireCursor, releaseResource
+
+
+# prefixes of the fields that have a value per state, except the cursor
+# which is not drawn
+_VISUAL_PREFIXES = tuple(sorted({name.rsplit("_", 1)[0] for name in FIELD_NAMES
+                                 if name.rsplit("_", 1)[-1] in STATES} - {"cursor_stockcursor"}))
+
+
+class CustomStyle:
+    """Immutable drawing properties for a single control state."""
+
+    __slots__ = ("pen",
+                 "brush_background",
+                 "brush_foreground",
+                 "brush_background_active",
+                 "background_gradient",
+                 "foreground_gradient",
+                 "font",
+                 "font_key",
+                 "cursor",
+                 "text_font_size",
+                 "text_font_facename",
+                 "text_foreground_colour",
+                 "corner_radius",
+                 "image",
+                 "image_channels",
+                 "image_size",
+                 "background_colour_active",
+                 "foreground_colour_active",
+                 "visual_key")
+
+    def __init__(self, config, state:str):
+
+        if state not in STATES:
+            raise ValueError("CustomStyle::Invalid control state.")
+
+        def field(name):
+            return getattr(config, f"{name}_{state}")
+
+        # ------------------- pen and brushes ------------------- #
+
+        borderWidth = field("border_width")
+        pen = acquirePen(field("border_colour"), borderWidth) if borderWidth else wx.TRANSPARENT_PEN
+
+        assign = object.__setattr__ # the record is read-only afterwards
+        assign(self, "pen", pen)
+        assign(self, "brush_background", acquireBrush(field("background_colour")))
+        assign(self, "brush_foreground", acquireBrush(field("foreground_colour")))
+        assign(self, "brush_background_active", acquireBrush(field("background_colour_active")))
+
+        # gradients are rasterized for the painted size (see
+        # CustomObject._getFillBrush)
+        assign(self, "background_gradient", parseGradient(field("background_linear_gradient")))
+        assign(self, "foreground_gradient", parseGradient(field("foreground_linear_gradient")))
+
+        # ------------------ text and cursor ------------------ #
+
+        assign(self, "text_font_size", field("text_font_size"))
+        assign(self, "text_font_facename", field("text_font_facename"))
+        assign(self, "text_foreground_colour", field("text_foreground_colour"))
+        assign(self, "font", getFont(self.text_font_size, self.text_font_facename))
+        assign(self, "font_key", getFontKey(self.text_font_size, self.text_font_facename))
+        stockCursor = wx.CURSOR_ARROW if (state == "default") else field("cursor_stockcursor")
+        assign(self, "cursor", acquireCursor(stockCursor))
+
+        # ----------------------- other ----------------------- #
+
+        assign(self, "corner_radius", field("corner_radius"))
+        assign(self, "image", field("image"))
+        assign(self, "image_channels", field("image_channels"))
+        assign(self, "image_size", field("image_size"))
+        assign(self, "background_colour_active", field("background_colour_active"))
+        assign(self, "foreground_colour_active", field("foreground_colour_active"))
+
+        # states with equal keys look the same
+        assign(self, "visual_key", tuple(getattr(config, f"{prefix}_{state}", None) for prefix in _VISUAL_PREFIXES))
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CustomStyle::Compiled styles are read-only.")
+
+
+    def __del__(self):
+        # the pooled resources are shared, so they are only released
+        for name in ("pen", "brush_background", "brush_foreground", "brush_background_active", "cursor"):
+            releaseResource(getattr(self, name, None))
+
+
+    def __getitem__(self, name:str):
+        # keeps the old dictionary access (drawing_properties["pen"])
+        # working for subclasses.
+        return getattr(self, name)
+
+
+def compileStyles(config) -> dict:
+    """Returns a {state: CustomStyle} dictionary for the config."""
+    return {state: CustomStyle(config, state) for state in STATES}
@@ -1,17 +1,35 @@
 # getDefaultConfig.py
 # wxCustomControls
-# Function that returns default configurations for controls.
+# Functions that return default configurations for controls. The
+# default configurations are built once per DPI scale and shared.
 # 28/oct/2024
 
 
-from ..utils.dip import dip
-from ..CustomConfig import CustomConfig
+from copy import copy
+from ..utils.dip import dip, getScaleFactor, usingScaleFactor
+from ..CustomConfig import CustomConfig, FIELDS
 
 
-def getDefaultConfig(object_type:str) -> CustomConfig:
-    """Returns the default configuration for the specified control."""
-    
-    configurations = {
+# default values registered by applications for their own classes.
+# object type -> dictionary, or function returning a dictionary (so
+# dip values can be recalculated for each DPI scale).
+_RegisteredDefaults = {}
+
+# dpi scale -> default values of the library controls
+_LibraryDefaults = {}
+
+# (object type, dpi scale) -> shared read-only CustomConfig
+_SharedConfigs = {}
+
+# functions called after registered defaults change, like the style
+# sheet updating the configs it resolved from them
+_RegistrationListeners = []
+
+
+def _getLibraryDefaults() -> dict:
+    """Returns the default values of the library controls for the
+    DPI scale used by dip()."""
+    return {
         "CustomPanel": {
             "background_colour_default": (255, 255, 255),
             "border_colour_default": (150, 150, 150),
@@ -147,14 +165,98 @@ def getDefaultConfig(object_type:str) -> CustomConfig:
         
     }
 
-    if object_type not in configurations.keys():
-        print("GetDefaultConfig::Incorrect control type. Returning base config.")
-        return CustomConfig()
 
-    # unpack dictionary to create config
-    return CustomConfig(**configurations[object_type])
+def registerDefaultConfig(object_type:str, values, extend:bool=False):
+    """Registers the default values for a class name. Values can be a
+    dictionary or a function that returns one. If extend is True, the
+    values are applied over the library defaults of the class instead
+    of replacing them. Subclasses of the registered class use these
+    defaults unless they register their own. The shared default configs
+    of every DPI scale are updated in place, so the objects that
+    already use them follow the new defaults (and are still rescaled on
+    DPI changes). Functions are called once per scale, with dip() and
+    getScaleFactor() using that scale."""
+    _RegisteredDefaults[object_type] = (values, extend)
+    for key in [key for key in _SharedConfigs if key[0] == object_type]:
+        _updateSharedConfig(_SharedConfigs[key], _getDefaultValues(object_type, key[1]))
+    for listener in _RegistrationListeners:
+        listener()
+
+
+def addRegistrationListener(listener):
+    """Calls the function (without arguments) every time default values
+    are registered."""
+    _RegistrationListeners.append(listener)
+
+
+def _updateSharedConfig(config:CustomConfig, values:dict):
+    """Writes the values (and the field defaults for the rest) to the
+    read-only shared config. Its subscribers are notified of the fields
+    that changed."""
+    newConfig = CustomConfig(**values)
+    config.SetReadOnly(False)
+    try:
+        for name in FIELDS:
+            setattr(config, name, getattr(newConfig, name))
+    finally:
+        config.SetReadOnly(True)
+
+
+def _getDefaultValues(object_type:str, scale) -> dict:
+    """Returns the default values for the class name, or None if the
+    class has no defaults."""
+    with usingScaleFactor(scale):
+        libraryDefaults = _LibraryDefaults.get(scale)
+        if libraryDefaults is None:
+            libraryDefaults = _LibraryDefaults[scale] = _getLibraryDefaults()
+        if object_type in _RegisteredDefaults:
+            values, extend = _RegisteredDefaults[object_type]
+            values = values() if callable(values) else values
+            if extend:
+                values = {**libraryDefaults.get(object_type, {}), **values}
+            return values
+        return libraryDefaults.get(object_type)
+
+
+def getSharedDefaultConfig(object_type, scale:float=None) -> CustomConfig:
+    """Returns the shared, read-only default configuration for the
+    specified control and DPI scale (the screen's if None). object_type
+    can be a class name or a class, in which case the defaults of its
+    closest registered ancestor are used."""
+
+    if scale is None:
+        scale = getScaleFactor()
+
+    names = [cls.__name__ for cls in object_type.__mro__] if isinstance(object_type, type) else [object_type]
+    for name in names:
+        config = _SharedConfigs.get((name, scale))
+        if config is not None:
+            return config
+        values = _getDefaultValues(name, scale)
+        if values is not None:
+            config = CustomConfig(**values)
+            config.SetReadOnly()
+            _SharedConfigs[(name, scale)] = config
+            return config
+
+    print("GetDefaultConfig::Incorrect control type. Returning base config.")
+    config = CustomConfig()
+    config.SetReadOnly()
+    _SharedConfigs[(names[0], scale)] = config
+    return config
+
+
+def getDefaultConfig(object_type, scale:float=None) -> CustomConfig:
+    """Returns the default configuration for the specified control, as
+    a new config that can be modified."""
+    return copy(getSharedDefaultConfig(object_type, scale))
 
-    
 
-    
-    
+def getRescaledDefaultConfig(config:CustomConfig, scale:float) -> CustomConfig:
+    """If the config is a shared default config, returns the shared
+    default config of the same control for the DPI scale. Returns None
+    for any other config."""
+    for (name, _), shared in list(_SharedConfigs.items()):
+        if shared is config:
+            return getSharedDefaultConfig(name, scale)
+    return None
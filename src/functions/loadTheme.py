@@ -0,0 +1,175 @@
+# loadTheme.py
+# wxCustomControls
+# Loads themes from json or toml files. A theme holds default
+# configurations for control classes and named configurations. The
+# validated theme is written to a precompiled cache next to the file,
+# so later launches skip parsing and validation.
+# 18/oct/2026
+
+
+import os
+import json
+import glob
+import hashlib
+import wx
+from ..utils.dip import getScaleFactor
+from ..utils.fontCache import clearFontCache
+from ..CustomConfig import CustomConfig, FIELDS, DIP_FIELDS, scaleDipValue, _toTuple
+from .getDefaultConfig import registerDefaultConfig
+
+try:
+    import tomllib
+except ImportError: # python < 3.11
+    tomllib = None
+
+
+# increased when the layout of the cache files changes
+_CACHE_FORMAT = 2
+
+
+def loadTheme(path:str, register:bool=True) -> dict:
+    """Loads a theme file and returns its named configs as a
+    {name: CustomConfig} dictionary. The class defaults of the theme
+    are registered over the library defaults, unless register is
+    False. Lengths are in device independent pixels and images are
+    paths relative to the theme file:
+
+        {
+            "defaults": {"CustomButton": {"corner_radius_default": 4}},
+            "configs": {"danger": {"background_colour_default": [200, 40, 40]}}
+        }
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+
+    scale = getScaleFactor()
+    digest = hashlib.sha256(content).hexdigest()[:16]
+    cachePath = _getCachePath(path, digest, scale)
+
+    theme = _readCache(cachePath)
+    if theme is None:
+        theme = _compileTheme(path, content, scale)
+        _writeCache(path, digest, cachePath, theme)
+
+    if register:
+        clearFontCache()
+        for object_type, (values, scaledValues) in theme["defaults"].items():
+            registerDefaultConfig(object_type, _getDefaultsFunction(values, scaledValues, scale), extend=True)
+
+    return {name: CustomConfig(**_loadImages(values)) for name, values in theme["configs"].items()}
+
+
+def _getDefaultsFunction(values:dict, scaledValues:dict, themeScale:float):
+    """Returns the function registered as class defaults, so the values
+    are rescaled if the DPI changes."""
+    def getValues():
+        scale = getScaleFactor()
+        return _loadImages(scaledValues if (scale == themeScale) else _scaleValues(values, scale))
+    return getValues
+
+
+# ------------------------- compiling ------------------------- #
+
+
+def _compileTheme(path:str, content:bytes, scale:float) -> dict:
+    """Parses and validates the theme."""
+    if path.lower().endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("loadTheme::Toml themes need python 3.11 or newer.")
+        data = tomllib.loads(content.decode("utf-8"))
+    else:
+        data = json.loads(content.decode("utf-8"))
+
+    if not isinstance(data, dict) or not (data.keys() <= {"defaults", "configs"}):
+        raise ValueError("loadTheme::A theme can only have \"defaults\" and \"configs\" sections.")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    defaults, configs = {}, {}
+    for object_type, values in data.get("defaults", {}).items():
+        values = _validateValues(values, object_type, directory)
+        defaults[object_type] = (values, _scaleValues(values, scale))
+    for name, values in data.get("configs", {}).items():
+        configs[name] = _scaleValues(_validateValues(values, name, directory), scale)
+
+    return {"format": _CACHE_FORMAT, "defaults": defaults, "configs": configs}
+
+
+def _validateValues(values:dict, where:str, directory:str) -> dict:
+    """Checks the keys and value types against the config schema."""
+    if not isinstance(values, dict):
+        raise ValueError(f"loadTheme::\"{where}\" must be a table of config values.")
+    validated = {}
+    for key, value in values.items():
+        field = FIELDS.get(key)
+        if field is None:
+            raise ValueError(f"loadTheme::Unknown key \"{key}\" in \"{where}\".")
+        value = _toTuple(value)
+        if (field.type is object): # images
+            if not isinstance(value, (str, type(None))):
+                raise ValueError(f"loadTheme::\"{key}\" in \"{where}\" must be an image path.")
+            if value is not None:
+                value = os.path.join(directory, value)
+        elif not isinstance(value, field.type):
+            raise ValueError(f"loadTheme::Wrong type for \"{key}\" in \"{where}\".")
+        validated[key] = value
+    return validated
+
+
+def _scaleValues(values:dict, scale:float) -> dict:
+    return {key: scaleDipValue(value, scale) if (key in DIP_FIELDS) else value
+            for key, value in values.items()}
+
+
+def _loadImages(values:dict) -> dict:
+    """Replaces image paths with wx.Image objects."""
+    return {key: wx.Image(value) if ((FIELDS[key].type is object) and isinstance(value, str)) else value
+            for key, value in values.items()}
+
+
+# --------------------------- cache --------------------------- #
+
+
+def _getCachePath(path:str, digest:str, scale:float) -> str:
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.{digest}-{round(scale * 100)}.cache")
+
+
+def _readCache(cachePath:str) -> dict:
+    """Returns the precompiled theme, or None if there is no usable
+    cache. The cache is plain json, so reading it cannot run code."""
+    try:
+        with open(cachePath, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("format") != _CACHE_FORMAT:
+            return None
+        return {"format": _CACHE_FORMAT,
+                "defaults": {object_type: (_tupleValues(values), _tupleValues(scaledValues))
+                             for object_type, (values, scaledValues) in data["defaults"].items()},
+                "configs": {name: _tupleValues(values) for name, values in data["configs"].items()}}
+    except Exception:
+        return None
+
+
+def _tupleValues(values:dict) -> dict:
+    """Restores the tuples that json stored as lists."""
+    if not isinstance(values, dict):
+        raise ValueError
+    return {key: _toTuple(value) for key, value in values.items()}
+
+
+def _writeCache(path:str, digest:str, cachePath:str, theme:dict):
+    """Writes the precompiled theme and removes the caches of older
+    versions of the file (caches of other DPI scales are kept).
+    Failing to write the cache (for example in a read-only directory)
+    is not an error."""
+    directory, name = os.path.split(os.path.abspath(path))
+    try:
+        for oldCache in glob.glob(os.path.join(glob.escape(directory), f".{glob.escape(name)}.*.cache")):
+            if not os.path.basename(oldCache).startswith(f".{name}.{digest}-"):
+                os.remove(oldCache)
+        temporaryPath = cachePath + ".tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as file:
+            json.dump(theme, file)
+        os.replace(temporaryPath, cachePath)
+    except OSError:
+        pass
@@ -0,0 +1,123 @@
+# assetCache.py
+# wxCustomControls
+# Optional on-disk cache of prerendered bitmaps (gradients, nine-slice
+# skins and processed images), so later launches load them instead of
+# rendering them again. Assets are stored as raw RGBA files named by a
+# hash of what they were rendered from, the DPI scale, the rendering
+# version and the wx version, so any change to those simply misses the
+# old files. The cache never makes painting fail: any error reading or
+# writing an asset falls back to rendering it.
+# 18/oct/2026
+
+
+import os
+import struct
+import hashlib
+import wx
+from .dip import getScaleFactor
+
+
+_Directory = None # disabled until a directory is set
+_Fingerprint = None
+_Stats = {"hits": 0, "misses": 0, "writes": 0}
+_HEADER = struct.Struct("<4sII") # magic, width, height
+_MAGIC = b"WCCA"
+
+# increased when the code that renders the assets (gradientCache,
+# nineSlice, imageCache) or the file layout changes
+_RENDER_VERSION = 2
+
+
+def setAssetCacheDirectory(path:str):
+    """Enables the cache in the directory (created if needed), or
+    disables it if path is None."""
+    global _Directory
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    _Directory = path
+
+
+def clearAssetCache():
+    """Removes all the stored assets, including the ones left by older
+    versions of the library."""
+    if _Directory is None:
+        return
+    for name in os.listdir(_Directory):
+        if name.endswith((".rgba", ".rgba.tmp")):
+            try:
+                os.remove(os.path.join(_Directory, name))
+            except OSError:
+                pass
+
+
+def isAssetCacheEnabled() -> bool:
+    return _Directory is not None
+
+
+def getAssetCacheStats() -> dict:
+    return {"directory": _Directory, **_Stats}
+
+
+def _getFingerprint() -> str:
+    global _Fingerprint
+    if _Fingerprint is None:
+        _Fingerprint = f"{_RENDER_VERSION}-{wx.version()}"
+    return _Fingerprint
+
+
+def _getAssetPath(kind:str, spec) -> str:
+    key = repr((kind, spec, getScaleFactor(), _getFingerprint())).encode()
+    return os.path.join(_Directory, f"{kind}-{hashlib.sha256(key).hexdigest()[:32]}.rgba")
+
+
+def loadAsset(kind:str, spec) -> wx.Bitmap:
+    """Returns the bitmap stored for (kind, spec) at the current DPI
+    scale, or None if the cache is disabled or has no such asset. spec
+    must have a stable repr (tuples of numbers and strings)."""
+    if _Directory is None:
+        return None
+    try:
+        with open(_getAssetPath(kind, spec), "rb") as file:
+            data = file.read()
+        magic, width, height = _HEADER.unpack_from(data)
+        if (magic != _MAGIC) or (len(data) != _HEADER.size + width * height * 4):
+            raise ValueError
+        bitmap = wx.Bitmap.FromBufferRGBA(width, height, data[_HEADER.size:])
+    except Exception:
+        _Stats["misses"] += 1
+        return None
+    _Stats["hits"] += 1
+    return bitmap
+
+
+def storeAsset(kind:str, spec, bitmap:wx.Bitmap):
+    """Stores the bitmap for (kind, spec). Failing to store it (for
+    example in a read-only directory) is not an error."""
+    if _Directory is None:
+        return
+    try:
+        width, height, pixels = _getRGBA(bitmap)
+        path = _getAssetPath(kind, spec)
+        with open(path + ".tmp", "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, width, height))
+            file.write(pixels)
+        os.replace(path + ".tmp", path)
+        _Stats["writes"] += 1
+    except Exception:
+        pass
+
+
+def _getRGBA(bitmap:wx.Bitmap) -> tuple:
+    """Returns the width, height and RGBA pixels of the bitmap. Works
+    for bitmaps without alpha (such as decoded jpegs) too."""
+    image = bitmap.ConvertToImage()
+    if not image.HasAlpha():
+        image.InitAlpha()
+    width, height = image.GetWidth(), image.GetHeight()
+    pixels = bytearray(width * height * 4)
+    rgb = bytes(image.GetData())
+    pixels[0::4] = rgb[0::3]
+    pixels[1::4] = rgb[1::3]
+    pixels[2::4] = rgb[2::3]
+    pixels[3::4] = bytes(image.GetAlpha())
+    return width, height, pixels
@@ -0,0 +1,92 @@
+# backBuffers.py
+# wxCustomControls
+# Back buffers shared by the paints of all the custom objects in a top
+# level window. Paints run one at a time, so each top level window
+# keeps a single buffer that grows to the largest window painted in
+# it, instead of every paint allocating a buffer of its own. Shared
+# buffers are capped, windows too big for the cap get a buffer of their
+# own for that paint, and the buffers count against the memory budget
+# of the cache registry.
+# 18/oct/2026
+
+
+import weakref
+import wx
+from .cacheRegistry import registerCache, enforceMemoryBudget, nextAccess
+
+
+_GROW_STEP = 64 # pixels, so resizing does not reallocate on every paint
+_MAX_SHARED_BYTES = 16 * 1024 * 1024 # largest buffer kept between paints
+
+# top level window -> [buffer, bytes, last access]
+_Buffers = weakref.WeakKeyDictionary()
+
+_Stats = {"allocations": 0, "allocated_bytes": 0, "reuses": 0, "oversized": 0}
+
+
+def _roundUp(value:int) -> int:
+    return max(-(-value // _GROW_STEP) * _GROW_STEP, _GROW_STEP)
+
+
+def getBackBuffer(window:wx.Window) -> wx.Bitmap:
+    """Returns the back buffer of the top level window of the window,
+    at least as big as its client size."""
+    topLevel = wx.GetTopLevelParent(window) or window
+    width, height = window.GetClientSize()
+    entry = _Buffers.get(topLevel)
+    if entry is not None:
+        buffer = entry[0]
+        if (buffer.GetWidth() >= width) and (buffer.GetHeight() >= height):
+            entry[2] = nextAccess()
+            _Stats["reuses"] += 1
+            return buffer
+
+    # grow to fit both the old and the new windows, or only the new one
+    # if that would pass the cap (a wide strip and a tall panel must not
+    # pin a buffer as wide as the first and as tall as the second)
+    newWidth, newHeight = _roundUp(width), _roundUp(height)
+    if entry is not None:
+        grownWidth = max(newWidth, entry[0].GetWidth())
+        grownHeight = max(newHeight, entry[0].GetHeight())
+        if grownWidth * grownHeight * 4 <= _MAX_SHARED_BYTES:
+            newWidth, newHeight = grownWidth, grownHeight
+
+    if newWidth * newHeight * 4 > _MAX_SHARED_BYTES:
+        # too big to keep, used only for this paint
+        _Stats["oversized"] += 1
+        return wx.Bitmap(max(width, 1), max(height, 1))
+
+    buffer = wx.Bitmap(newWidth, newHeight)
+    _Buffers[topLevel] = [buffer, newWidth * newHeight * 4, nextAccess()]
+    _Stats["allocations"] += 1
+    _Stats["allocated_bytes"] += newWidth * newHeight * 4
+    enforceMemoryBudget()
+    return buffer
+
+
+def getBackBufferStats() -> dict:
+    return {**_Stats,
+            "buffers": len(_Buffers),
+            "bytes": _RegistryView().GetMemorySize()}
+
+
+class _RegistryView:
+    """The shared back buffers, as seen by the cache registry."""
+
+    def GetMemorySize(self) -> int:
+        return sum(entry[1] for entry in _Buffers.values())
+
+    def GetStats(self) -> dict:
+        return getBackBufferStats()
+
+    def GetOldestAccess(self):
+        return min((entry[2] for entry in _Buffers.values()), default=None)
+
+    def EvictOldest(self) -> int:
+        if not _Buffers:
+            return 0
+        topLevel = min(_Buffers.keys(), key=lambda key: _Buffers[key][2])
+        return _Buffers.pop(topLevel)[1]
+
+
+registerCache("back_buffers", _RegistryView())
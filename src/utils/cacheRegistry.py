@@ -0,0 +1,64 @@
+# cacheRegistry.py
+# wxCustomControls
+# Registry of the caches of the library. Every cache reports its
+# estimated memory and counters, and all of them share one memory
+# budget: when it is exceeded, the least recently used entry among all
+# the caches is evicted until the total fits again.
+# 18/oct/2026
+
+
+from itertools import count
+
+
+_Caches = {} # name -> cache
+_Budget = 128 * 1024 * 1024 # bytes
+_Evictions = 0
+
+# global access counter, so entries of different caches can be compared
+nextAccess = count().__next__
+
+
+def registerCache(name:str, cache):
+    """Registers a cache. Caches implement GetMemorySize() (bytes),
+    GetStats() (dict), GetOldestAccess() (access counter of their least
+    recently used entry, or None if empty) and EvictOldest() (bytes
+    freed)."""
+    _Caches[name] = cache
+
+
+def setMemoryBudget(maxBytes:int):
+    """Sets the memory shared by all the caches."""
+    global _Budget
+    _Budget = maxBytes
+    enforceMemoryBudget()
+
+
+def getMemoryBudget() -> int:
+    return _Budget
+
+
+def enforceMemoryBudget():
+    """Evicts the least recently used entries of all the caches until
+    their memory fits in the budget."""
+    global _Evictions
+    total = sum(cache.GetMemorySize() for cache in _Caches.values())
+    while total > _Budget:
+        oldest = None
+        for cache in _Caches.values():
+            access = cache.GetOldestAccess()
+            if (access is not None) and ((oldest is None) or (access < oldest[0])):
+                oldest = (access, cache)
+        if oldest is None:
+            break
+        total -= oldest[1].EvictOldest()
+        _Evictions += 1
+
+
+def stats() -> dict:
+    """Returns a snapshot of the memory and counters of every cache."""
+    caches = {name: {**cache.GetStats(), "bytes": cache.GetMemorySize()}
+              for name, cache in _Caches.items()}
+    return {"budget": _Budget,
+            "bytes": sum(cache["bytes"] for cache in caches.values()),
+            "evictions": _Evictions,
+            "caches": caches}
@@ -1,10 +1,104 @@
+from contextlib import contextmanager
 import wx
 
-def dip(*args):
-    """Returns size using device independent pixels."""
+
+# display index (-1 for the screen dc) -> scale factor
+_ScaleFactors = {}
+
+
+def getScaleFactor(display:int=None) -> float:
+    """Returns the DIP scale factor of the display (the screen if
+    None). The value is cached until the DPI changes."""
+    key = -1 if display is None else display
+    scale = _ScaleFactors.get(key)
+    if scale is None:
+        if display is None:
+            scale = wx.ScreenDC().FromDIP(wx.Size(100, 0))[0] / 100
+        else:
+            scale = wx.Display(display).GetScaleFactor()
+        _ScaleFactors[key] = scale
+    return scale
+
+
+def clearScaleFactorCache():
+    """Forgets the cached scale factors. Called when the DPI changes."""
+    _ScaleFactors.clear()
+
+
+def setScaleFactor(scale:float):
+    """Sets the scale factor used by dip() for values that do not
+    belong to a window."""
+    _ScaleFactors.clear()
+    _ScaleFactors[-1] = scale
+
+
+@contextmanager
+def usingScaleFactor(scale:float):
+    """Makes getScaleFactor() and dip() use the scale inside the with
+    block, for example to build the default configs of a window on
+    another display."""
+    previous = _ScaleFactors.get(-1)
+    _ScaleFactors[-1] = scale
+    try:
+        yield
+    finally:
+        if previous is None:
+            _ScaleFactors.pop(-1, None)
+        else:
+            _ScaleFactors[-1] = previous
+
+
+def getWindowScaleFactor(window:wx.Window) -> float:
+    """Returns the DIP scale factor of the top level window of the
+    window, which depends on the display it is on. It is kept in the
+    top level window until its DPI changes (see propagateDpiChange)."""
+    topLevel = wx.GetTopLevelParent(window) if window else None
+    if not topLevel:
+        return getScaleFactor()
+    scale = getattr(topLevel, "_DipScale", None)
+    if scale is None:
+        scale = topLevel._DipScale = topLevel.FromDIP(wx.Size(100, 0))[0] / 100
+    return scale
+
+
+def _scale(value, scale):
+    # same rounding as wxWidgets, and -1 (default coordinate) is kept
+    if value == -1:
+        return -1
+    return int(value * scale + (0.5 if value >= 0 else -0.5))
+
+
+def dip(*args, window:wx.Window=None):
+    """Returns size using device independent pixels, for the display
+    of the window (the screen if None)."""
+    scale = getWindowScaleFactor(window) if window else (_ScaleFactors.get(-1) or getScaleFactor())
     if len(args) == 1:
-        return wx.ScreenDC().FromDIP(wx.Size(args[0], 0))[0]
+        return _scale(args[0], scale)
     elif len(args) == 2:
-        return wx.ScreenDC().FromDIP(wx.Size(args[0], args[1]))
+        return wx.Size(_scale(args[0], scale), _scale(args[1], scale))
     else:
         raise ValueError("DIP: Exceeded number of arguments.")
+
+
+def dipBatch(values, window:wx.Window=None):
+    """Scales several values at once, for the display of the window
+    (the screen if None). Accepts tuples, lists, wx.Size, wx.Point,
+    wx.Rect and numpy arrays, and returns the same type."""
+    scale = getWindowScaleFactor(window) if window else (_ScaleFactors.get(-1) or getScaleFactor())
+    if isinstance(values, wx.Size):
+        return wx.Size(_scale(values.width, scale), _scale(values.height, scale))
+    if isinstance(values, wx.Point):
+        return wx.Point(_scale(values.x, scale), _scale(values.y, scale))
+    if isinstance(values, wx.Rect):
+        return wx.Rect(_scale(values.x, scale), _scale(values.y, scale),
+                       _scale(values.width, scale), _scale(values.height, scale))
+    if type(values).__module__ == "numpy":
+        # numpy is only imported when an array is passed, so it is not
+        # loaded at startup. rounds half away from zero, like _scale.
+        import numpy
+        scaled = (numpy.sign(values) * numpy.floor(numpy.abs(values) * scale + 0.5)).astype(values.dtype)
+        scaled[values == -1] = -1
+        return scaled
+    if isinstance(values, (tuple, list)):
+        return type(values)(_scale(value, scale) for value in values)
+    raise TypeError("DIP: Unsupported type for batch scaling.")
@@ -1,6 +1,54 @@
+import wx
 import ctypes
 import platform
+from .dip import getWindowScaleFactor
+from .fontCache import clearFontCache
+from .textMetrics import clearTextExtentCache
+from .imageCache import clearImageCache
 
 def setDpiAwareness():
     if platform.system() == "Windows":
         ctypes.windll.shcore.SetProcessDpiAwareness(1)
+
+
+def propagateDpiChange(topLevel:wx.Window, ratio:float):
+    """Updates every custom object in the top level window after its
+    DPI changed by ratio (new dpi / old dpi). Works in a single pass
+    under Freeze, followed by one layout and one refresh. Can be
+    called directly to simulate a DPI change. The scale is kept in the
+    top level window, windows on other displays are not affected."""
+    if (ratio == 1.0):
+        return
+    topLevel._DipScale = getWindowScaleFactor(topLevel) * ratio
+    clearFontCache()
+    clearTextExtentCache()
+    clearImageCache()
+    topLevel.Freeze()
+    try:
+        windows = [topLevel]
+        while windows:
+            window = windows.pop()
+            if hasattr(window, "_rescaleForDpi"):
+                window._rescaleForDpi(ratio)
+            windows.extend(window.GetChildren())
+        topLevel.Layout()
+    finally:
+        topLevel.Thaw()
+    topLevel.Refresh()
+
+
+def _onDpiChanged(event:wx.DPIChangedEvent):
+    oldDpi, newDpi = event.GetOldDPI(), event.GetNewDPI()
+    if oldDpi.GetHeight():
+        propagateDpiChange(event.GetEventObject(), newDpi.GetHeight() / oldDpi.GetHeight())
+    event.Skip()
+
+
+def watchDpiChanges(window:wx.Window):
+    """Makes the top level window of the window update its custom
+    objects when it receives a wx.EVT_DPI_CHANGED. Binds only once per
+    top level window."""
+    topLevel = wx.GetTopLevelParent(window)
+    if topLevel and not getattr(topLevel, "_dpiWatched", False):
+        topLevel._dpiWatched = True
+        topLevel.Bind(wx.EVT_DPI_CHANGED, _onDpiChanged)
@@ -0,0 +1,43 @@
+# fontCache.py
+# wxCustomControls
+# Process-wide cache of wx.Font objects, so identical fonts are only
+# created once instead of on every paint and best size query.
+# 18/oct/2026
+
+
+import wx
+from .dip import getScaleFactor
+from .lruCache import LRUCache
+
+
+# font key -> wx.Font. the size of a font is estimated, fonts hold
+# platform resources besides their python object.
+_Fonts = LRUCache(maxSize=256, name="fonts", unitBytes=1024)
+
+
+def getFontKey(size, facename:str="", family=wx.FONTFAMILY_DEFAULT,
+               style=wx.FONTSTYLE_NORMAL, weight=wx.FONTWEIGHT_NORMAL) -> tuple:
+    """Returns the key that identifies a font in the cache."""
+    return (size, family, style, weight, facename, getScaleFactor())
+
+
+def getFont(size, facename:str="", family=wx.FONTFAMILY_DEFAULT,
+            style=wx.FONTSTYLE_NORMAL, weight=wx.FONTWEIGHT_NORMAL) -> wx.Font:
+    """Returns a shared font. The returned font must not be
+    modified."""
+    key = (size, family, style, weight, facename, getScaleFactor())
+    font = _Fonts.Get(key)
+    if font is None:
+        font = wx.Font(size, family, style, weight, faceName=facename)
+        _Fonts.Put(key, font)
+    return font
+
+
+def clearFontCache():
+    """Drops all the cached fonts. Called when the DPI or the theme
+    changes."""
+    _Fonts.Clear()
+
+
+def getFontCacheStats() -> dict:
+    return _Fonts.GetStats()
@@ -0,0 +1,90 @@
+# gdiPool.py
+# wxCustomControls
+# Pool of pens, brushes and cursors interned by value. Every user of a
+# resource acquires it and releases it when done, so identical
+# resources are created once and shared, and the number of live
+# GDI/X resources can be monitored.
+# 18/oct/2026
+
+
+from collections import OrderedDict
+import wx
+
+
+_Resources = {}          # key -> [resource, reference count]
+_Keys = {}               # id(resource) -> key
+_Idle = OrderedDict()    # keys of unreferenced resources, oldest first
+_MAX_IDLE = 64           # unreferenced resources kept for reuse
+_Stats = {"created": 0, "reused": 0, "destroyed": 0, "peak": 0}
+_LiveCount = 0
+
+
+def _colourKey(colour) -> tuple:
+    return wx.Colour(colour).Get(includeAlpha=True)
+
+
+def _acquire(key:tuple, create):
+    global _LiveCount
+    entry = _Resources.get(key)
+    if entry is None:
+        entry = _Resources[key] = [create(), 0]
+        _Keys[id(entry[0])] = key
+        _Stats["created"] += 1
+    else:
+        _Stats["reused"] += 1
+    if entry[1] == 0:
+        _Idle.pop(key, None)
+        _LiveCount += 1
+        _Stats["peak"] = max(_Stats["peak"], _LiveCount)
+    entry[1] += 1
+    return entry[0]
+
+
+def acquirePen(colour, width:int=1, style=wx.PENSTYLE_SOLID) -> wx.Pen:
+    """Returns a shared pen. It must not be modified and must be
+    released with releaseResource."""
+    key = ("pen", _colourKey(colour), width, style)
+    return _acquire(key, lambda: wx.Pen(wx.Colour(*key[1]), width, style))
+
+
+def acquireBrush(colour) -> wx.Brush:
+    """Returns a shared brush. It must not be modified and must be
+    released with releaseResource."""
+    key = ("brush", _colourKey(colour))
+    return _acquire(key, lambda: wx.Brush(wx.Colour(*key[1])))
+
+
+def acquireCursor(stockCursor:int) -> wx.Cursor:
+    """Returns a shared stock cursor. It must be released with
+    releaseResource."""
+    return _acquire(("cursor", stockCursor), lambda: wx.Cursor(stockCursor))
+
+
+def releaseResource(resource):
+    """Releases a resource returned by one of the acquire functions.
+    Other objects (like the stock pens and brushes) are ignored."""
+    global _LiveCount
+    key = _Keys.get(id(resource))
+    if key is None:
+        return
+    entry = _Resources[key]
+    entry[1] -= 1
+    if entry[1] > 0:
+        return
+    _LiveCount -= 1
+    _Idle[key] = None
+    while len(_Idle) > _MAX_IDLE:
+        oldKey, _ = _Idle.popitem(last=False)
+        del _Keys[id(_Resources.pop(oldKey)[0])]
+        _Stats["destroyed"] += 1
+
+
+def getGdiPoolStats() -> dict:
+    """Returns the number of live (referenced) and pooled resources per
+    kind, the peak number of live resources and the creation counters."""
+    live = {"pen": 0, "brush": 0, "cursor": 0}
+    for key, (_, references) in _Resources.items():
+        if references:
+            live[key[0]] += 1
+    return {"live": _LiveCount, "live_by_kind": live, "pooled": len(_Resources),
+            "idle": len(_Idle), **_Stats}
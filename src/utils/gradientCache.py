@@ -0,0 +1,92 @@
+# gradientCache.py
+# wxCustomControls
+# Linear gradients rasterized once per (gradient, size) into bitmaps
+# that are painted as stipple brushes, instead of being computed by
+# the graphics backend on every paint. The bitmaps are shared by every
+# control using the same gradient.
+# 18/oct/2026
+
+
+import wx
+from .lruCache import LRUCache
+from .assetCache import loadAsset, storeAsset
+
+
+_Brushes = LRUCache(maxSize=16 * 1024 * 1024, name="gradients") # (gradient, size) -> wx.Brush, bytes
+
+
+def parseGradient(gradient:tuple) -> tuple:
+    """Returns the gradient as (x1, y1, x2, y2, stops), where stops is
+    a tuple of (position, rgba colour) from 0.0 to 1.0. Accepts:
+
+        (x1, y1, x2, y2, colour1, colour2)              two colours
+        (x1, y1, x2, y2, colour1, colour2, colour3...)  evenly spaced
+        (x1, y1, x2, y2, ((0.0, colour1), (0.3, colour2), (1.0, colour3)))
+    """
+    if not gradient:
+        return None
+    x1, y1, x2, y2, *colours = gradient
+    if (len(colours) == 1) and isinstance(colours[0][0], tuple):
+        stops = tuple(sorted((float(position), wx.Colour(colour).Get(includeAlpha=True))
+                             for position, colour in colours[0]))
+    else:
+        if len(colours) < 2:
+            raise ValueError("parseGradient::A gradient needs at least two colours.")
+        stops = tuple((index / (len(colours) - 1), wx.Colour(colour).Get(includeAlpha=True))
+                      for index, colour in enumerate(colours))
+    if len(stops) < 2:
+        raise ValueError("parseGradient::A gradient needs at least two colours.")
+    return (x1, y1, x2, y2, stops)
+
+
+def setGradientCacheBudget(maxBytes:int):
+    _Brushes.SetMaxSize(maxBytes)
+
+
+def clearGradientCache():
+    _Brushes.Clear()
+
+
+def getGradientCacheStats() -> dict:
+    return _Brushes.GetStats()
+
+
+def getGradientBrush(gradient:tuple, size:tuple) -> wx.Brush:
+    """Returns a brush that fills an area of size (starting at the
+    origin of the dc) with the parsed gradient. Vertical and horizontal
+    gradients are rasterized as a single pixel strip that the brush
+    repeats, so controls of any width (or height) share it."""
+    x1, y1, x2, y2, _ = gradient
+    width, height = max(size[0], 1), max(size[1], 1)
+    if (x1 == x2):
+        width = 1
+    elif (y1 == y2):
+        height = 1
+    key = (gradient, width, height)
+    brush = _Brushes.Get(key)
+    if brush is None:
+        bitmap = loadAsset("gradient", key)
+        if bitmap is None:
+            bitmap = _rasterize(gradient, width, height)
+            storeAsset("gradient", key, bitmap)
+        brush = wx.Brush(bitmap)
+        _Brushes.Put(key, brush, width * height * 4)
+    return brush
+
+
+def _rasterize(gradient:tuple, width:int, height:int) -> wx.Bitmap:
+    x1, y1, x2, y2, stops = gradient
+    (_, first), *middle, (_, last) = stops
+    gradientStops = wx.GraphicsGradientStops(wx.Colour(*first), wx.Colour(*last))
+    for position, colour in middle:
+        gradientStops.Add(wx.Colour(*colour), position)
+
+    bitmap = wx.Bitmap.FromRGBA(width, height, 0, 0, 0, 0)
+    dc = wx.MemoryDC(bitmap)
+    gc = wx.GraphicsContext.Create(dc)
+    gc.SetPen(wx.TRANSPARENT_PEN)
+    gc.SetBrush(gc.CreateLinearGradientBrush(x1, y1, x2, y2, gradientStops))
+    gc.DrawRectangle(0, 0, width, height)
+    del gc # flushes the drawing into the bitmap
+    dc.SelectObject(wx.NullBitmap)
+    return bitmap
@@ -0,0 +1,66 @@
+# imageCache.py
+# wxCustomControls
+# Cache of the bitmaps drawn for config images. Adjusting the channels,
+# rescaling and converting an image to a bitmap are full pixel passes,
+# so they are done once per (image, channels, size, DPI) and the
+# resulting bitmaps are shared by every control drawing them.
+# 18/oct/2026
+
+
+import hashlib
+import wx
+from .dip import getScaleFactor
+from .lruCache import LRUCache
+from .assetCache import isAssetCacheEnabled, loadAsset, storeAsset
+
+
+# (image id, channels, size, dpi scale) -> (image, bitmap). The image is
+# kept alive by the entry so its id cannot be reused while cached.
+_Bitmaps = LRUCache(maxSize=32 * 1024 * 1024, name="images") # bytes
+
+_NO_ADJUSTMENT = (1.0, 1.0, 1.0, 1.0)
+
+
+def setImageCacheBudget(maxBytes:int):
+    """Sets the maximum memory used by the cached bitmaps."""
+    _Bitmaps.SetMaxSize(maxBytes)
+
+
+def clearImageCache():
+    _Bitmaps.Clear()
+
+
+def getImageCacheStats() -> dict:
+    return _Bitmaps.GetStats()
+
+
+def getImageBitmap(image:wx.Image, channels:tuple, size:tuple) -> wx.Bitmap:
+    """Returns the image with its channels adjusted and resampled to
+    size as a bitmap, or None if the size is empty. The returned
+    bitmap is shared and must not be modified."""
+    width, height = size
+    if (width <= 0) or (height <= 0):
+        return None
+    key = (id(image), channels, (width, height), getScaleFactor())
+    entry = _Bitmaps.Get(key)
+    if entry is None:
+        bitmap, spec = None, None
+        if isAssetCacheEnabled():
+            # images on disk are identified by their pixels
+            digest = hashlib.sha256(image.GetData())
+            if image.HasAlpha():
+                digest.update(image.GetAlpha())
+            spec = (digest.hexdigest(), image.GetWidth(), image.GetHeight(), tuple(channels), (width, height))
+            bitmap = loadAsset("image", spec)
+        if bitmap is None:
+            processed = image
+            if (image.GetWidth(), image.GetHeight()) != (width, height):
+                processed = processed.Scale(width, height, wx.IMAGE_QUALITY_HIGH)
+            if tuple(channels) != _NO_ADJUSTMENT:
+                processed = processed.AdjustChannels(*channels)
+            bitmap = processed.ConvertToBitmap()
+            if spec:
+                storeAsset("image", spec, bitmap)
+        entry = (image, bitmap)
+        _Bitmaps.Put(key, entry, width * height * 4)
+    return entry[1]
@@ -0,0 +1,106 @@
+# lruCache.py
+# wxCustomControls
+# Small least recently used cache shared by the caches of the library.
+# 18/oct/2026
+
+
+from collections import OrderedDict
+from .cacheRegistry import registerCache, enforceMemoryBudget, nextAccess
+
+
+class LRUCache:
+    """Dictionary bounded to maxSize. Every entry counts as 1 unless it
+    is stored with a size (for example its size in bytes). The least
+    recently used entries are dropped first. Named caches are
+    registered in the cache registry, which estimates their memory as
+    unitBytes per unit of size."""
+
+    def __init__(self, maxSize:int, name:str=None, unitBytes:int=1):
+
+        self._Entries = OrderedDict() # key -> [value, size, last access]
+        self._MaxSize = maxSize
+        self._UnitBytes = unitBytes
+        self._TotalSize = 0
+        self._Hits = 0
+        self._Misses = 0
+        self._Evictions = 0
+        self._Registered = name is not None
+        if self._Registered:
+            registerCache(name, self)
+
+
+    def Get(self, key, default=None):
+        entry = self._Entries.get(key)
+        if entry is None:
+            self._Misses += 1
+            return default
+        self._Entries.move_to_end(key)
+        entry[2] = nextAccess()
+        self._Hits += 1
+        return entry[0]
+
+
+    def Put(self, key, value, size:int=1):
+        """Stores the value. Values bigger than the whole cache are not
+        stored."""
+        self.Remove(key)
+        if size > self._MaxSize:
+            return
+        self._Entries[key] = [value, size, nextAccess()]
+        self._TotalSize += size
+        while self._TotalSize > self._MaxSize:
+            self.EvictOldest()
+        if self._Registered:
+            enforceMemoryBudget()
+
+
+    def Remove(self, key):
+        entry = self._Entries.pop(key, None)
+        if entry is not None:
+            self._TotalSize -= entry[1]
+
+
+    def Clear(self):
+        self._Entries.clear()
+        self._TotalSize = 0
+
+
+    def SetMaxSize(self, maxSize:int):
+        self._MaxSize = maxSize
+        while self._TotalSize > maxSize:
+            self.EvictOldest()
+
+
+    def GetMaxSize(self) -> int:
+        return self._MaxSize
+
+
+    def GetMemorySize(self) -> int:
+        return self._TotalSize * self._UnitBytes
+
+
+    def GetOldestAccess(self):
+        for entry in self._Entries.values():
+            return entry[2]
+        return None
+
+
+    def EvictOldest(self) -> int:
+        """Drops the least recently used entry and returns its memory."""
+        _, (_, size, _) = self._Entries.popitem(last=False)
+        self._TotalSize -= size
+        self._Evictions += 1
+        return size * self._UnitBytes
+
+
+    def GetStats(self) -> dict:
+        return {"entries": len(self._Entries), "size": self._TotalSize, "max_size": self._MaxSize,
+                "hits": self._Hits, "misses": self._Misses, "evictions": self._Evictions}
+
+
+    def __len__(self):
+        return len(self._Entries)
+
+
+    def __contains__(self, key):
+        return key in self._Entries
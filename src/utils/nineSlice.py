@@ -0,0 +1,116 @@
+# nineSlice.py
+# wxCustomControls
+# Nine-slice skins for rounded rectangles. A rounded rectangle with a
+# border only depends on its size in the middle, so the corners and
+# edges are rasterized once per (border, fill, radius, DPI) into a small
+# atlas, and rectangles of any size are composed from its slices: the
+# corners are copied and the edges and center are stretched.
+# 18/oct/2026
+
+
+import math
+import wx
+from .dip import getScaleFactor
+from .lruCache import LRUCache
+from .assetCache import loadAsset, storeAsset
+
+
+_Skins = LRUCache(maxSize=4 * 1024 * 1024, name="nine_slices") # skin key -> NineSlice, bytes
+
+
+def clearNineSliceCache():
+    _Skins.Clear()
+
+
+def getNineSliceCacheStats() -> dict:
+    return _Skins.GetStats()
+
+
+class NineSlice:
+    """Slices of a rounded rectangle drawn with a pen and a brush."""
+
+    def __init__(self, pen:wx.Pen, brush:wx.Brush, radius:int, spec:tuple=None):
+
+        penWidth = pen.GetWidth() if (pen.GetStyle() != wx.PENSTYLE_TRANSPARENT) else 0
+
+        # like the vector path, the border is centered on the outline of
+        # the rectangle, so half of it falls outside. the skin covers
+        # the rectangle grown by that half (rounded up).
+        self._Offset = offset = math.ceil(penWidth / 2)
+
+        # corners also hold the border and its antialiased pixels
+        self._Corner = corner = offset + max(math.ceil(radius), 1) + penWidth + 1
+        size = 2 * corner + 1
+
+        # spec identifies the skin in the on-disk asset cache
+        atlas = loadAsset("nine_slice", spec) if spec else None
+        if atlas is None:
+            atlas = wx.Bitmap.FromRGBA(size, size, 0, 0, 0, 0)
+            dc = wx.MemoryDC(atlas)
+            gc = wx.GraphicsContext.Create(dc)
+            gc.SetPen(pen)
+            gc.SetBrush(brush)
+            gc.DrawRoundedRectangle(offset, offset, size - 2 * offset, size - 2 * offset, radius)
+            del gc # flushes the drawing into the bitmap
+            dc.SelectObject(wx.NullBitmap)
+            if spec:
+                storeAsset("nine_slice", spec, atlas)
+        self._Atlas = atlas
+        self._MemorySize = size * size * 4 # bytes
+
+        # (x, y, width, height) of the slices in the atlas, rows of
+        # left, middle and right slices from top to bottom
+        far = size - corner
+        self._Slices = [[atlas.GetSubBitmap(wx.Rect(x, y, width, height))
+                         for x, width in ((0, corner), (corner, 1), (far, corner))]
+                        for y, height in ((0, corner), (corner, 1), (far, corner))]
+
+        # id(renderer) -> (renderer, slices converted for it), so the
+        # slices are converted once instead of on every draw
+        self._GraphicsSlices = {}
+
+
+    def GetMemorySize(self) -> int:
+        return self._MemorySize
+
+
+    def CanDraw(self, width:int, height:int) -> bool:
+        """Rectangles smaller than two corners can not be composed."""
+        minimum = 2 * (self._Corner - self._Offset)
+        return (width >= minimum) and (height >= minimum)
+
+
+    def _getGraphicsSlices(self, gc:wx.GraphicsContext) -> list:
+        renderer = gc.GetRenderer()
+        entry = self._GraphicsSlices.get(id(renderer))
+        if entry is None:
+            entry = (renderer, [[gc.CreateBitmap(bitmap) for bitmap in row] for row in self._Slices])
+            self._GraphicsSlices[id(renderer)] = entry
+        return entry[1]
+
+
+    def Draw(self, gc:wx.GraphicsContext, x, y, width, height):
+        """Draws the rounded rectangle (x, y, width, height) the way the
+        vector path does, border included."""
+        offset = self._Offset
+        x, y, width, height = x - offset, y - offset, width + 2 * offset, height + 2 * offset
+        corner = self._Corner
+        columns = ((x, corner), (x + corner, width - 2 * corner), (x + width - corner, corner))
+        rows = ((y, corner), (y + corner, height - 2 * corner), (y + height - corner, corner))
+        quality = gc.GetInterpolationQuality()
+        gc.SetInterpolationQuality(wx.INTERPOLATION_NONE)
+        for (sliceY, sliceHeight), slices in zip(rows, self._getGraphicsSlices(gc)):
+            for (sliceX, sliceWidth), bitmap in zip(columns, slices):
+                gc.DrawBitmap(bitmap, sliceX, sliceY, sliceWidth, sliceHeight)
+        gc.SetInterpolationQuality(quality)
+
+
+def getNineSlice(pen:wx.Pen, brush:wx.Brush, radius:int) -> NineSlice:
+    """Returns the shared skin for the pen, brush and corner radius."""
+    penKey = (pen.GetColour().GetRGBA(), pen.GetWidth()) if (pen.GetStyle() != wx.PENSTYLE_TRANSPARENT) else None
+    key = (penKey, brush.GetColour().GetRGBA(), radius, getScaleFactor())
+    skin = _Skins.Get(key)
+    if skin is None:
+        skin = NineSlice(pen, brush, radius, key[:3])
+        _Skins.Put(key, skin, skin.GetMemorySize())
+    return skin
@@ -0,0 +1,185 @@
+# repaintQueue.py
+# wxCustomControls
+# Frame scheduler for repaints. Controls mark themselves (or a part of
+# themselves) dirty instead of refreshing, and a single tick paced at
+# the target frame rate refreshes every dirty window once. Work that
+# only needs its latest input (like scrolling to the pointer while
+# dragging) is requested as a frame callback and runs once per tick,
+# and layouts are deferred to one pass per window and tick.
+# Changes to shared configs are coalesced in the same tick, so every
+# control subscribed to a changed config is updated once per frame
+# instead of once per changed field.
+# 18/oct/2026
+
+
+import time
+import wx
+
+
+_PendingConfigs = {} # config -> set of changed field names
+_DirtyWindows = {}   # window -> dirty wx.Rect, or None for the whole window
+_FrameCallbacks = {} # callback -> None (an ordered set)
+_PendingLayouts = {} # window -> None (an ordered set)
+_FlushScheduled = False
+
+_TargetFrameRate = 60
+_Immediate = False
+_LastFrame = 0.0
+
+_Stats = {"requested": 0, "performed": 0, "frames": 0,
+          "callbacks_requested": 0, "callbacks_performed": 0,
+          "layouts_requested": 0, "layouts_performed": 0}
+
+
+def setTargetFrameRate(rate:float):
+    """Sets the maximum number of repaint passes per second."""
+    global _TargetFrameRate
+    if rate <= 0:
+        raise ValueError("setTargetFrameRate::The rate must be positive.")
+    _TargetFrameRate = rate
+
+
+def getTargetFrameRate() -> float:
+    return _TargetFrameRate
+
+
+def setImmediateMode(immediate:bool):
+    """If True, refresh requests are passed to the windows right away
+    instead of waiting for the next frame. Pending requests are flushed
+    when it is enabled."""
+    global _Immediate
+    _Immediate = immediate
+    if immediate and (_DirtyWindows or _FrameCallbacks or _PendingLayouts):
+        flushRepaints()
+
+
+def isImmediateMode() -> bool:
+    return _Immediate
+
+
+def requestRefresh(window:wx.Window, rect:wx.Rect=None):
+    """Marks the window (or the rectangle of it) dirty. Every dirty
+    window is refreshed once in the next frame."""
+    _Stats["requested"] += 1
+    if _Immediate:
+        _refresh(window, rect)
+        return
+    if window in _DirtyWindows:
+        dirty = _DirtyWindows[window]
+        if (dirty is not None) and (rect is not None):
+            _DirtyWindows[window] = dirty.Union(rect)
+        else:
+            _DirtyWindows[window] = None
+    else:
+        _DirtyWindows[window] = None if rect is None else wx.Rect(rect)
+    _scheduleFrame()
+
+
+def requestFrameCallback(callback):
+    """Calls the callback once in the next frame, before the dirty
+    windows are refreshed, however many times it was requested."""
+    _Stats["callbacks_requested"] += 1
+    if _Immediate:
+        _Stats["callbacks_performed"] += 1
+        callback()
+        return
+    _FrameCallbacks[callback] = None
+    _scheduleFrame()
+
+
+def requestLayout(window:wx.Window):
+    """Lays out the window once in the next frame, before the dirty
+    windows are refreshed."""
+    _Stats["layouts_requested"] += 1
+    if _Immediate:
+        _layout(window)
+        return
+    _PendingLayouts[window] = None
+    _scheduleFrame()
+
+
+def scheduleConfigRepaint(config, field:str):
+    """Marks the field of the config as changed and schedules a single
+    repaint pass for the subscribers of all changed configs."""
+    fields = _PendingConfigs.get(config)
+    if fields is None:
+        _PendingConfigs[config] = {field}
+    else:
+        fields.add(field)
+    _scheduleFrame()
+
+
+def _scheduleFrame():
+    """Schedules the next frame, no sooner than the frame interval
+    after the previous one."""
+    global _FlushScheduled
+    if _FlushScheduled:
+        return
+    _FlushScheduled = True
+    wait = 0 if _Immediate else (1 / _TargetFrameRate) - (time.perf_counter() - _LastFrame)
+    if wait > 0:
+        wx.CallLater(max(int(wait * 1000), 1), flushRepaints)
+    else:
+        wx.CallAfter(flushRepaints)
+
+
+def _refresh(window:wx.Window, rect:wx.Rect):
+    if not window: # the window might have been destroyed
+        return
+    _Stats["performed"] += 1
+    if rect is None:
+        window.Refresh()
+    else:
+        window.RefreshRect(rect)
+
+
+def _layout(window:wx.Window):
+    if not window: # the window might have been destroyed
+        return
+    _Stats["layouts_performed"] += 1
+    window.Layout()
+
+
+def flushRepaints():
+    """Performs a frame: runs the frame callbacks, notifies the
+    subscribers of every changed config, lays out the windows that
+    requested it and refreshes every dirty window. Can be called
+    directly to apply the pending changes immediately."""
+    global _FlushScheduled, _LastFrame
+    _FlushScheduled = False
+    _LastFrame = time.perf_counter()
+    _Stats["frames"] += 1
+
+    callbacks = list(_FrameCallbacks)
+    _FrameCallbacks.clear()
+    for callback in callbacks:
+        _Stats["callbacks_performed"] += 1
+        callback()
+
+    pending = list(_PendingConfigs.items())
+    _PendingConfigs.clear()
+    for config, fields in pending:
+        for subscriber in config.GetSubscribers():
+            if subscriber: # the window might have been destroyed
+                subscriber._onSharedConfigChanged(fields)
+
+    layouts = list(_PendingLayouts)
+    _PendingLayouts.clear()
+    for window in layouts:
+        _layout(window)
+
+    # the work above marks its windows dirty for this frame
+    dirty = list(_DirtyWindows.items())
+    _DirtyWindows.clear()
+    for window, rect in dirty:
+        _refresh(window, rect)
+
+
+def getFrameSchedulerStats() -> dict:
+    """Returns the number of requested and performed refreshes,
+    frame callbacks and layouts, the number of frames, and the
+    pending dirty windows."""
+    return {**_Stats,
+            "pending": len(_DirtyWindows),
+            "target_frame_rate": _TargetFrameRate,
+            "immediate": _Immediate}
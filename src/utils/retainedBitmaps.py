@@ -0,0 +1,129 @@
+# retainedBitmaps.py
+# wxCustomControls
+# Bitmaps of the visual states of controls in retained bitmap mode.
+# Each control keeps its states in its own least recently used cache,
+# and all of them share a global memory budget: when it is exceeded,
+# states are dropped from the least recently painted controls first.
+# 18/oct/2026
+
+
+from collections import OrderedDict
+from .cacheRegistry import registerCache, enforceMemoryBudget, nextAccess
+
+
+_Caches = OrderedDict() # id(cache) -> cache, least recently used first
+_Budget = 64 * 1024 * 1024 # bytes
+_TotalBytes = 0
+
+
+def setRetainedBitmapBudget(maxBytes:int):
+    """Sets the memory shared by the bitmaps of all the controls."""
+    global _Budget
+    _Budget = maxBytes
+    _enforceBudget()
+
+
+def getRetainedBitmapStats() -> dict:
+    return {"controls": len(_Caches), "bytes": _TotalBytes, "budget": _Budget,
+            "bitmaps": sum(len(cache) for cache in _Caches.values())}
+
+
+def _evictOldest() -> int:
+    """Drops the oldest state of the least recently painted control."""
+    global _TotalBytes
+    cache = next(iter(_Caches.values()))
+    size = cache._popOldest()
+    _TotalBytes -= size
+    if not cache:
+        del _Caches[id(cache)]
+    return size
+
+
+def _enforceBudget():
+    while (_TotalBytes > _Budget) and _Caches:
+        _evictOldest()
+
+
+class _RegistryView:
+    """All the retained bitmaps, as seen by the cache registry."""
+
+    def GetMemorySize(self) -> int:
+        return _TotalBytes
+
+    def GetStats(self) -> dict:
+        return getRetainedBitmapStats()
+
+    def GetOldestAccess(self):
+        for cache in _Caches.values():
+            return cache._getOldestAccess()
+        return None
+
+    def EvictOldest(self) -> int:
+        return _evictOldest()
+
+
+registerCache("retained_bitmaps", _RegistryView())
+
+
+class RetainedBitmapCache:
+    """The bitmaps of a single control, one per visual state."""
+
+    def __init__(self, maxStates:int=8):
+
+        self._Bitmaps = OrderedDict() # state key -> [bitmap, bytes, last access]
+        self._MaxStates = maxStates
+
+
+    def Get(self, key):
+        entry = self._Bitmaps.get(key)
+        if entry is None:
+            return None
+        self._Bitmaps.move_to_end(key)
+        _Caches.move_to_end(id(self))
+        entry[2] = nextAccess()
+        return entry[0]
+
+
+    def Put(self, key, bitmap, size:int):
+        """Stores the bitmap of the state. size is in bytes."""
+        global _TotalBytes
+        self.Remove(key)
+        self._Bitmaps[key] = [bitmap, size, nextAccess()]
+        _TotalBytes += size
+        while len(self._Bitmaps) > self._MaxStates:
+            _TotalBytes -= self._popOldest()
+        _Caches[id(self)] = self
+        _Caches.move_to_end(id(self))
+        _enforceBudget()
+        enforceMemoryBudget()
+
+
+    def Remove(self, key):
+        global _TotalBytes
+        entry = self._Bitmaps.pop(key, None)
+        if entry is not None:
+            _TotalBytes -= entry[1]
+
+
+    def Clear(self):
+        """Drops all the states. Called when the contents of the
+        control change and on destruction."""
+        global _TotalBytes
+        _TotalBytes -= sum(size for _, size, _ in self._Bitmaps.values())
+        self._Bitmaps.clear()
+        _Caches.pop(id(self), None)
+
+
+    def _popOldest(self) -> int:
+        _, (_, size, _) = self._Bitmaps.popitem(last=False)
+        return size
+
+
+    def _getOldestAccess(self):
+        for _, _, access in self._Bitmaps.values():
+            return access
+        return None
+
+
+    def __len__(self):
+        return len(self._Bitmaps)
@@ -0,0 +1,84 @@
+# textMetrics.py
+# wxCustomControls
+# Cache of text extents keyed by (font key, string), so labels are not
+# measured again on every paint and best size query, and a batch API
+# that measures many strings on a single DC.
+# 18/oct/2026
+
+
+import wx
+from .lruCache import LRUCache
+from .fontCache import getFont, getFontKey
+
+
+_Extents = LRUCache(maxSize=4096, name="text_extents", unitBytes=256) # (font key, string) -> (width, height)
+_MeasureDC = None
+
+
+def setTextExtentCacheSize(maxSize:int):
+    """Sets the maximum number of measured strings kept in the cache."""
+    _Extents.SetMaxSize(maxSize)
+
+
+def clearTextExtentCache():
+    _Extents.Clear()
+
+
+def getTextExtentCacheStats() -> dict:
+    return _Extents.GetStats()
+
+
+def getTextExtent(dc, fontKey:tuple, text:str) -> tuple:
+    """Returns the (width, height) of the text. The font identified by
+    fontKey must already be set on the dc (a wx.DC or a
+    wx.GraphicsContext). Extents are rounded to ints like a wx.GCDC
+    does, so every caller gets the same values from the cache."""
+    key = (fontKey, text)
+    extent = _Extents.Get(key)
+    if extent is None:
+        extent = dc.GetTextExtent(text)
+        extent = (int(extent[0] + 0.5), int(extent[1] + 0.5))
+        _Extents.Put(key, extent)
+    return extent
+
+
+def getTextExtents(texts, size, facename:str="", dc=None) -> list:
+    """Measures all the strings with the font of the size and facename
+    and returns their (width, height) in the same order. Strings that
+    are not cached are measured on a single dc, a wx.DC or a
+    wx.GraphicsContext (a shared measuring dc if None)."""
+    fontKey = getFontKey(size, facename)
+    extents, missing = [], {}
+    for index, text in enumerate(texts):
+        extent = _Extents.Get((fontKey, text))
+        extents.append(extent)
+        if extent is None:
+            missing.setdefault(text, []).append(index)
+
+    if missing:
+        if dc is None:
+            dc = _getMeasureDC()
+        if isinstance(dc, wx.GraphicsContext):
+            # the colour is required but does not affect the extents
+            dc.SetFont(getFont(size, facename), wx.BLACK)
+        else:
+            dc.SetFont(getFont(size, facename))
+        getExtent = dc.GetTextExtent
+        for text, indices in missing.items():
+            width, height = getExtent(text)[:2]
+            extent = (int(width + 0.5), int(height + 0.5))
+            _Extents.Put((fontKey, text), extent)
+            for index in indices:
+                extents[index] = extent
+    return extents
+
+
+def _getMeasureDC() -> wx.GCDC:
+    """Returns a dc used to measure text outside of paint events. It
+    uses the same renderer as the paint handlers, so the extents match
+    the ones measured while painting."""
+    global _MeasureDC
+    if _MeasureDC is None:
+        memoryDC = wx.MemoryDC(wx.Bitmap(1, 1))
+        _MeasureDC = (wx.GCDC(memoryDC), memoryDC)
+    return _MeasureDC[0]